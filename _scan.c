@@ -0,0 +1,132 @@
+/*
+ * Optional C accelerator for bash_search.py.
+ *
+ * scan(buffer, needle) -> list of (line_number, line_start, line_end)
+ *
+ * Finds every line of `buffer` (any bytes-like object, e.g. an mmap)
+ * that contains `needle`, using memmem for the substring search and
+ * memchr for line counting. The whole loop runs with the GIL released,
+ * so the scan does no per-match bytecode dispatch and other threads
+ * keep running. Offsets are byte positions into `buffer`; line_end
+ * excludes the newline.
+ *
+ * bash_search.py falls back to bytes.find when this module is not
+ * built. To build it in place (the resulting .so is git-ignored):
+ *
+ *     cc -O2 -shared -fPIC $(python3-config --includes) _scan.c \
+ *         -o _scan$(python3-config --extension-suffix)
+ *
+ * On macOS also pass `-undefined dynamic_lookup`.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+typedef struct {
+    Py_ssize_t line;
+    Py_ssize_t start;
+    Py_ssize_t end;
+} match_t;
+
+static PyObject *
+scan(PyObject *self, PyObject *args)
+{
+    Py_buffer haystack, needle;
+    match_t *matches = NULL;
+    Py_ssize_t count = 0, capacity = 0;
+    int out_of_memory = 0;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "y*y*", &haystack, &needle)) {
+        return NULL;
+    }
+
+    if (needle.len > 0) {
+        Py_BEGIN_ALLOW_THREADS
+        const char *base = haystack.buf;
+        const char *end = base + haystack.len;
+        const char *pos = base;
+        const char *counted = base;
+        const char *line_start = base;
+        Py_ssize_t line = 1;
+
+        while (pos < end
+               && (pos = memmem(pos, end - pos, needle.buf, needle.len)) != NULL) {
+            const char *newline;
+            const char *line_end;
+
+            /* Count the newlines between the previous line and this match */
+            while ((newline = memchr(counted, '\n', pos - counted)) != NULL) {
+                line++;
+                line_start = newline + 1;
+                counted = newline + 1;
+            }
+
+            line_end = memchr(pos, '\n', end - pos);
+            if (line_end == NULL) {
+                line_end = end;
+            }
+
+            if (count == capacity) {
+                Py_ssize_t new_capacity = capacity ? capacity * 2 : 64;
+                match_t *grown = PyMem_RawRealloc(
+                    matches, (size_t)new_capacity * sizeof(match_t));
+                if (grown == NULL) {
+                    out_of_memory = 1;
+                    break;
+                }
+                matches = grown;
+                capacity = new_capacity;
+            }
+            matches[count].line = line;
+            matches[count].start = line_start - base;
+            matches[count].end = line_end - base;
+            count++;
+
+            /* Resume after this line; its newline is counted next round */
+            pos = line_end;
+            counted = line_end;
+        }
+        Py_END_ALLOW_THREADS
+    }
+
+    PyBuffer_Release(&haystack);
+    PyBuffer_Release(&needle);
+
+    if (out_of_memory) {
+        PyMem_RawFree(matches);
+        return PyErr_NoMemory();
+    }
+
+    result = PyList_New(count);
+    if (result != NULL) {
+        for (Py_ssize_t i = 0; i < count; i++) {
+            PyObject *item = Py_BuildValue(
+                "(nnn)", matches[i].line, matches[i].start, matches[i].end);
+            if (item == NULL) {
+                Py_CLEAR(result);
+                break;
+            }
+            PyList_SET_ITEM(result, i, item);
+        }
+    }
+    PyMem_RawFree(matches);
+    return result;
+}
+
+static PyMethodDef scan_methods[] = {
+    {"scan", scan, METH_VARARGS,
+     "scan(buffer, needle) -> list of (line_number, line_start, line_end)"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef scan_module = {
+    PyModuleDef_HEAD_INIT, "_scan",
+    "memmem-based line scanner used by bash_search.py.", -1, scan_methods
+};
+
+PyMODINIT_FUNC
+PyInit__scan(void)
+{
+    return PyModule_Create(&scan_module);
+}
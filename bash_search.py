@@ -1,26 +1,364 @@
 """
 Simple Grep CLI. Type your search term
 and press Enter.
-Press Ctrl+C to exit.
+Press Ctrl+C (or Ctrl+D) to exit.
+
+The REPL keeps a single long-lived worker process (this script run
+with --worker) that scans files in-process with mmap + bytes.find, so
+no process is spawned per query. One-off searches from the command line
+are delegated to ripgrep (`rg --fixed-strings`) when it is installed.
 
 Usage:
     python bash_search.py
     python bash_search.py "search term"
 """
+import fnmatch
+import functools
+import mmap
+import multiprocessing
+import os
+import re
+import shutil
+import signal
 import subprocess
-import shlex
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+try:
+    # Optional C scanner (see _scan.c for build instructions)
+    from _scan import scan as c_scan
+except ImportError:
+    c_scan = None
 
 # Define the base directory for search
 BASE_DIR = "/Users/malevich/Repos/swingcity-dashboard"
 
-# Define the grep command options
-GREP_OPTIONS = (
-    '--exclude="*.md" '
-    '--exclude-dir={node_modules,dist,vendor,filament,'
-    'guides,logs,storage,docs,database}'
+# File name patterns and directory names excluded from the search
+EXCLUDE_FILES = ("*.md",)
+EXCLUDE_DIRS = (
+    "node_modules", "dist", "vendor", "filament",
+    "guides", "logs", "storage", "docs", "database",
 )
 
 
+def compile_globs(patterns):
+    """
+    Compile glob patterns into one anchored regex, so each name is
+    checked with a single match call. An empty list never matches.
+    """
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns) or "(?!)")
+
+
+# Compiled forms of the exclusions used by the in-process walker
+EXCLUDE_FILES_RE = compile_globs(EXCLUDE_FILES)
+EXCLUDE_DIRS_RE = compile_globs(EXCLUDE_DIRS)
+
+# Path to the ripgrep binary, or None to use the in-process scanner
+RG_PATH = shutil.which("rg")
+
+
+def available_cpus():
+    """Return the number of CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1  # macOS and Windows have no affinity API
+
+
+# Number of processes (or ripgrep threads) used to scan files. On a warm
+# page cache the scan is memory-bandwidth bound, so more than ~8 workers
+# adds context switches without adding throughput.
+MAX_SCAN_WORKERS = 8
+SCAN_WORKERS = min(available_cpus(), MAX_SCAN_WORKERS)
+
+# ripgrep argv up to the search term, built once at import time.
+# Arguments are passed directly (no shell), so nothing needs quoting.
+RG_ARGS = [
+    RG_PATH, "--fixed-strings", "--line-number", "--with-filename",
+    "--no-heading", "--color=never", "--hidden", "--no-ignore",
+    f"--threads={SCAN_WORKERS}",
+    *(f"--glob=!{pattern}" for pattern in EXCLUDE_FILES),
+    *(f"--glob=!{name}/" for name in EXCLUDE_DIRS),
+]
+
+# The walk only fans out to a thread pool when the top-level directory
+# has more subdirectories than this; small trees are walked serially
+PARALLEL_WALK_MIN_DIRS = 4
+
+# Line written by the worker after each batch of results
+SENTINEL = "\x1e\n"
+
+# File list for BASE_DIR, cached across queries along with the
+# BASE_DIR mtime it was built at
+_file_cache = {"mtime": None, "files": []}
+
+# Recent results kept by the worker: search term -> (time, matches),
+# least recently used first. Entries older than RESULT_CACHE_TTL
+# seconds are not reused, so edits to file contents show up quickly.
+RESULT_CACHE_SIZE = 64
+RESULT_CACHE_TTL = 30.0
+_result_cache = OrderedDict()
+
+
+def rg_search(search_term):
+    """
+    Search BASE_DIR with ripgrep, streaming its output to stdout
+    without decoding it or holding it all in memory.
+
+    The search term is passed as a literal (--fixed-strings) in argv
+    form, so no shell is involved and no quoting is needed.
+
+    Returns True if any match was printed.
+    """
+    found = False
+    sys.stdout.flush()
+    with subprocess.Popen(
+        [*RG_ARGS, "--regexp", search_term, BASE_DIR],
+        stdout=subprocess.PIPE,
+    ) as process:
+        # Copy raw output in chunks of up to 64 KiB; read1 returns as soon
+        # as any data is available, so the first matches show up right away
+        for chunk in iter(lambda: process.stdout.read1(65536), b""):
+            sys.stdout.buffer.write(chunk)
+            found = True
+    sys.stdout.buffer.flush()
+    return found
+
+
+def scan_dir(path):
+    """
+    List one directory, returning (files, subdirs) with exclusions
+    applied. Symlinked directories are not followed.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not EXCLUDE_DIRS_RE.match(entry.name):
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        if not EXCLUDE_FILES_RE.match(entry.name):
+                            files.append(entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return files, subdirs
+
+
+def walk_parallel(root):
+    """
+    Return the paths of all non-excluded files below root.
+
+    Directories are listed with os.scandir. When root has more than
+    PARALLEL_WALK_MIN_DIRS subdirectories, each subdirectory is listed
+    as a separate task on a thread pool (scandir releases the GIL), and
+    every subdirectory it finds is submitted as a new task.
+    """
+    files, subdirs = scan_dir(root)
+
+    if len(subdirs) <= PARALLEL_WALK_MIN_DIRS:
+        while subdirs:
+            found_files, found_dirs = scan_dir(subdirs.pop())
+            files.extend(found_files)
+            subdirs.extend(found_dirs)
+        return files
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        pending = {pool.submit(scan_dir, path) for path in subdirs}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found_files, found_dirs = future.result()
+                files.extend(found_files)
+                pending.update(pool.submit(scan_dir, path) for path in found_dirs)
+    return files
+
+
+def cached_files():
+    """
+    Return the list of files to search, walking BASE_DIR only when
+    needed.
+
+    The walk is redone when the mtime of BASE_DIR changes, i.e. when
+    entries are added to or removed from the top-level directory.
+    Changes further down the tree are picked up on the next restart.
+    """
+    try:
+        mtime = os.stat(BASE_DIR).st_mtime
+    except OSError:
+        return []
+
+    if mtime != _file_cache["mtime"]:
+        _file_cache["files"] = walk_parallel(BASE_DIR)
+        _file_cache["mtime"] = mtime
+        _result_cache.clear()
+    return _file_cache["files"]
+
+
+def scan_file(path, needle):
+    """
+    Yield (line_number, line) for every line of path containing needle.
+
+    The file is mmapped and searched over the whole buffer rather than
+    line by line: with the _scan extension when it is built (memmem,
+    GIL released, one call per file), otherwise with bytes.find.
+    Binary files (a NUL byte in the first 8 KiB) and unreadable files
+    are skipped.
+    """
+    try:
+        with open(path, "rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                if buf.find(b"\0", 0, 8192) != -1:
+                    return
+                if c_scan is not None:
+                    for line_number, start, end in c_scan(buf, needle):
+                        yield line_number, buf[start:end]
+                    return
+                line_number = 1
+                counted = 0
+                pos = buf.find(needle)
+                while pos != -1:
+                    start = buf.rfind(b"\n", 0, pos) + 1
+                    end = buf.find(b"\n", pos)
+                    if end == -1:
+                        end = len(buf)
+                    line_number += buf[counted:start].count(b"\n")
+                    counted = start
+                    yield line_number, buf[start:end]
+                    pos = buf.find(needle, end)
+    except (OSError, ValueError):
+        return
+
+
+def scan_one(path, needle):
+    """Return the matches in one file as (path, line_number, text) tuples."""
+    return [
+        (path, line_number, line.decode("utf-8", "replace"))
+        for line_number, line in scan_file(path, needle)
+    ]
+
+
+def print_matches(matches):
+    """Print matches in grep's path:line:content format."""
+    sys.stdout.write("".join(
+        f"{path}:{line_number}:{text}\n" for path, line_number, text in matches
+    ))
+
+
+def ignore_sigint():
+    """Pool initializer: leave Ctrl+C handling to the parent process."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def create_pool():
+    """Create the process pool used to scan files in parallel."""
+    return multiprocessing.Pool(SCAN_WORKERS, initializer=ignore_sigint)
+
+
+def scan_search(search_term, files, pool):
+    """
+    Search the given files on the process pool, printing matches as
+    each file completes.
+
+    Files are handed out in chunks and results are collected in
+    completion order; only this process writes to stdout, so lines
+    from different files never interleave.
+
+    Returns the list of matches printed.
+    """
+    scan = functools.partial(scan_one, needle=search_term.encode("utf-8"))
+    matches = []
+    for file_matches in pool.imap_unordered(scan, files, chunksize=64):
+        if file_matches:
+            print_matches(file_matches)
+            matches.extend(file_matches)
+    return matches
+
+
+def cached_search(search_term, files, pool):
+    """
+    Print the matches for search_term, reusing recent results.
+
+    An exact repeat within RESULT_CACHE_TTL is answered from the cache.
+    When a cached term is a substring of search_term (e.g. "Test" then
+    "Test String"), every new match is among the cached lines, so those
+    are filtered instead of rescanning the tree; the filtered entry
+    keeps the original timestamp so it expires with its source.
+    """
+    now = time.monotonic()
+    entry = _result_cache.get(search_term)
+    if entry and now - entry[0] < RESULT_CACHE_TTL:
+        _result_cache.move_to_end(search_term)
+        print_matches(entry[1])
+        return
+
+    for cached_term, (stamp, cached_matches) in reversed(_result_cache.items()):
+        if cached_term in search_term and now - stamp < RESULT_CACHE_TTL:
+            matches = [m for m in cached_matches if search_term in m[2]]
+            print_matches(matches)
+            break
+    else:
+        stamp = now
+        matches = scan_search(search_term, files, pool)
+
+    _result_cache[search_term] = (stamp, matches)
+    _result_cache.move_to_end(search_term)
+    if len(_result_cache) > RESULT_CACHE_SIZE:
+        _result_cache.popitem(last=False)
+
+
+def search_once(search_term):
+    """Run a single search, preferring ripgrep when it is installed."""
+    if RG_PATH:
+        found = rg_search(search_term)
+    else:
+        with create_pool() as pool:
+            found = scan_search(search_term, walk_parallel(BASE_DIR), pool)
+
+    if not found:
+        print("No results")
+
+
+def run_worker():
+    """
+    Serve search requests from stdin until EOF.
+
+    Each line read from stdin is a search term. Matching lines are
+    written to stdout followed by SENTINEL, then stdout is flushed
+    so the REPL knows the batch is complete. The directory walk, the
+    scanning process pool and recent results are kept between requests.
+    """
+    try:
+        with create_pool() as pool:
+            for line in iter(sys.stdin.readline, ""):
+                search_term = line.rstrip("\n")
+                if search_term:
+                    cached_search(search_term, cached_files(), pool)
+                sys.stdout.write(SENTINEL)
+                sys.stdout.flush()
+    except KeyboardInterrupt:
+        pass
+
+
+def start_worker():
+    """Spawn the long-lived search worker used by the REPL."""
+    return subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--worker"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        encoding="utf-8",
+        errors="replace",
+        env=dict(os.environ, PYTHONIOENCODING="utf-8"),
+    )
+
+
 def main():
     """
     Main entry point for the Grep CLI.
@@ -28,50 +366,61 @@ def main():
     Prints a simple banner and loop forever,
     prompting the user for a search term. If the user
     enters an empty string, it is skipped.
-    Otherwise, the search term is escaped and
-    executed as a grep command. The results of the
-    command are displayed on the console. If the command
-    fails, an error is raised.
+    Otherwise, the search term is sent to the search
+    worker, which is spawned once at startup and reused
+    for every query. Matching lines are printed as the
+    worker reports them.
 
-    The loop can be exited by pressing Ctrl+C.
+    The loop can be exited by pressing Ctrl+C or Ctrl+D.
     """
     print(
         "Simple Grep CLI. Type your search term and press Enter."
     )
     print("Press Ctrl+C to exit.\n")
 
-    while True:
+    # Read lines straight from stdin; input() adds per-call prompt and
+    # readline-hook overhead that this plain loop does not need
+    read_line = sys.stdin.readline
+
+    with start_worker() as searcher:
         try:
-            # Get user input for the search term
-            search_term = input("Search: ").strip()
-            if not search_term:
-                continue  # Skip empty inputs
-
-            # Escape special characters in the search term
-            safe_search_term = shlex.quote(search_term)
-
-            # Construct the full grep command
-            command = f'grep -rHn {safe_search_term} {GREP_OPTIONS} {BASE_DIR}'
-
-            # Execute the command using subprocess
-            result = subprocess.run(
-                command,
-                shell=True,
-                check=True,  # Raise an error if the command fails
-                text=True,
-                capture_output=True
-                )
-
-            # Display the results
-            if result.stdout:
-                print(result.stdout)
-            else:
-                print("No results")
+            while True:
+                # Get user input for the search term
+                sys.stdout.write("Search: ")
+                sys.stdout.flush()
+                line = read_line()
+                if not line:
+                    print("\nExiting Grep CLI.")
+                    break  # End of input (Ctrl+D or a closed pipe)
+
+                search_term = line.strip()
+                if not search_term:
+                    continue  # Skip empty inputs
+
+                searcher.stdin.write(search_term + "\n")
+                searcher.stdin.flush()
+
+                # Display the results until the end-of-batch sentinel
+                found = False
+                for line in iter(searcher.stdout.readline, ""):
+                    if line == SENTINEL:
+                        break
+                    print(line, end="")
+                    found = True
+
+                if not found:
+                    print("No results")
 
         except KeyboardInterrupt:
             print("\nExiting Grep CLI.")
-            break
+        finally:
+            searcher.terminate()
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:] == ["--worker"]:
+        run_worker()
+    elif len(sys.argv) > 1:
+        search_once(" ".join(sys.argv[1:]))
+    else:
+        main()
@@ -6,8 +6,6 @@ This will print directly to stdout for maximum visibility.
 import sys
 import os
 import time
-import inspect
-from datetime import datetime
 
 # Set to True to enable debug logs
 DEBUG_ENABLED = True
@@ -24,26 +22,43 @@ LEVELS = {
 # Current log level - only logs at this level or higher will be shown
 CURRENT_LEVEL = "TRACE"
 
+# Numeric value of CURRENT_LEVEL, kept in sync by set_level()
+_threshold = LEVELS[CURRENT_LEVEL]
+
+# HH:MM:SS prefix of the last timestamp, reformatted once per second
+_stamp_second = None
+_stamp_prefix = ""
+
+def _timestamp():
+    """Return the current local time as HH:MM:SS.mmm."""
+    global _stamp_second, _stamp_prefix
+    now = time.time()
+    second = int(now)
+    if second != _stamp_second:
+        _stamp_prefix = time.strftime("%H:%M:%S", time.localtime(second))
+        _stamp_second = second
+    return f"{_stamp_prefix}.{int((now - second) * 1000):03d}"
+
 def log(level, message, *args):
     """Log a message at the specified level."""
     if not DEBUG_ENABLED:
         return
         
-    if LEVELS.get(level, 0) < LEVELS.get(CURRENT_LEVEL, 0):
+    if LEVELS.get(level, 0) < _threshold:
         return
         
     # Format message with args
     if args:
         message = message.format(*args)
     
-    # Get calling frame info
-    caller = inspect.currentframe().f_back
+    # Get calling frame info (sys._getframe avoids inspect's overhead)
+    caller = sys._getframe(1)
     filename = os.path.basename(caller.f_code.co_filename)
     lineno = caller.f_lineno
     function = caller.f_code.co_name
     
     # Format timestamp
-    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    timestamp = _timestamp()
     
     # Print directly to stdout to bypass any formatting
     sys.stdout.write(f"[{timestamp}] {level:5} {filename}:{lineno} {function}() - {message}\n")
@@ -71,20 +86,48 @@ def error(message, *args):
 
 def set_level(level):
     """Set the current log level."""
-    global CURRENT_LEVEL
+    global CURRENT_LEVEL, _threshold
     if level in LEVELS:
         CURRENT_LEVEL = level
+        _threshold = LEVELS[level]
         info("Log level set to {}", level)
     else:
         warn("Invalid log level: {}", level)
         
+def _noop(message, *args):
+    """Stand-in for the log helpers while debug logging is disabled."""
+
+# The real log helpers, by module-level name
+_LOG_FUNCTIONS = {
+    "trace": trace,
+    "debug": debug,
+    "info": info,
+    "warn": warn,
+    "error": error,
+}
+
+def _bind_log_functions():
+    """Point the module-level log helpers at the real functions or the no-op.
+
+    While disabled, a call such as cli_debug.trace(...) is a single call to
+    _noop. Call the helpers through the module (not via `from ... import`)
+    so that enable()/disable() take effect.
+    """
+    namespace = globals()
+    for name, function in _LOG_FUNCTIONS.items():
+        namespace[name] = function if DEBUG_ENABLED else _noop
+
 def enable():
     """Enable debug logging."""
     global DEBUG_ENABLED
     DEBUG_ENABLED = True
+    _bind_log_functions()
     info("Debug logging enabled")
     
 def disable():
     """Disable debug logging."""
     global DEBUG_ENABLED
-    DEBUG_ENABLED = False
\ No newline at end of file
+    DEBUG_ENABLED = False
+    _bind_log_functions()
+
+_bind_log_functions()
@@ -1,8 +1,9 @@
 """Exclusions command implementation."""
+import io
 import sys
-from typing import List, Optional
+from typing import Dict, List, Optional
 import click
-from rich.console import Console
+from cli.console import get_console
 from rich.table import Table
 
 from cli.managers.config_manager import ConfigManager
@@ -10,9 +11,74 @@ from cli.managers.exclusions_manager import ExclusionsManager
 from cli.managers.exclusions_updater import handle_exclusion_update
 from cli.managers.theme_manager import ThemeManager
 
-console = Console()
+console = get_console()
 theme = ThemeManager.get_theme()
 
+# Rendered list_exclusions output, keyed on the exclusions, detected
+# names and theme colors it was built from (oldest entry evicted first)
+_RENDER_CACHE_SIZE = 4
+_render_cache: Dict[tuple, str] = {}
+_buf = io.StringIO()
+
+def _read_line() -> str:
+    """Read one line of prompt input; returns "" at end of input."""
+    # Looked up per call so a swapped-in stdin (REPL capture, CliRunner) is honored
+    return sys.stdin.readline()
+
+def _render_exclusions(framework, language, user_path, user_string,
+                       framework_name, language_name, header_color, highlight_color):
+    """Build the markup printed by list_exclusions from pre-sorted pattern sequences."""
+    # Write into one reused buffer instead of joining a list of small strings
+    _buf.seek(0)
+    _buf.truncate()
+    write = _buf.write
+
+    # Build the item markup once rather than formatting it per pattern
+    open_tag = f"- [{highlight_color}]"
+    close_tag = f"[/{highlight_color}]\n"
+
+    # Framework-Specific Exclusions
+    if framework:
+        write(f"\n\n[{header_color}]{framework_name} Framework-Specific Exclusions (Path)[/{header_color}]\n\n")
+
+        for pattern in framework:
+            write(open_tag + pattern + close_tag)
+
+        write("\n___\n\n")  # Section divider
+
+    # Language-Specific Exclusions
+    if language:
+        write(f"[{header_color}]{language_name} Language-Specific Exclusions (Path)[/{header_color}]\n\n")
+
+        for pattern in language:
+            write(open_tag + pattern + close_tag)
+
+        write("\n___\n\n")  # Section divider
+
+    # User-Defined Path Exclusions
+    if user_path:
+        write(f"[{header_color}]User-Defined Path Exclusions[/{header_color}]\n\n")
+
+        for pattern in user_path:
+            write(open_tag + pattern + close_tag)
+
+        write("\n___\n\n")  # Section divider
+        
+    # User-Defined String Exclusions
+    if user_string:
+        write(f"[{header_color}]User-Defined String Exclusions[/{header_color}]\n\n")
+
+        for pattern in user_string:
+            write(open_tag + pattern + close_tag)
+
+        write("\n___\n\n")  # Section divider
+        
+    # If no user exclusions
+    if not user_path and not user_string:
+        write(f"[{header_color}]No current user-added exclusions.[/{header_color}]\n\n")
+
+    return _buf.getvalue().strip()
+
 def list_exclusions():
     """List all current exclusions."""
     config = ConfigManager()
@@ -26,60 +92,47 @@ def list_exclusions():
         return
     
     # Ensure all colors come from the theme
-    title_color = theme["title"]
     header_color = theme["header"]
     highlight_color = theme["highlight"]
 
-    output = []
-
-    # Framework-Specific Exclusions
-    if exclusions.get("framework"):
-        framework_name = next(iter(exclusions_manager.detected_frameworks), "Unknown")
-        output.append(f"\n\n[{header_color}]{framework_name} Framework-Specific Exclusions (Path)[/{header_color}]\n")
-
-        for pattern in sorted(exclusions["framework"]):
-            output.append(f"- [{highlight_color}]{pattern}[/{highlight_color}]")
-
-        output.append("\n___\n")  # Section divider
-
-    # Language-Specific Exclusions
+    framework_name = next(iter(exclusions_manager.detected_frameworks), "Unknown")
     language_name = "Unknown"
     for detected_framework in exclusions_manager.detected_frameworks:
         if detected_framework in exclusions_manager.EXCLUSIONS_BY_LANGUAGE:
             language_name = detected_framework
 
-    if exclusions.get("language"):
-        output.append(f"[{header_color}]{language_name} Language-Specific Exclusions (Path)[/{header_color}]\n")
-
-        for pattern in sorted(exclusions["language"]):
-            output.append(f"- [{highlight_color}]{pattern}[/{highlight_color}]")
-
-        output.append("\n___\n")  # Section divider
-
-    # User-Defined Path Exclusions
-    if exclusions.get("user_path"):
-        output.append(f"[{header_color}]User-Defined Path Exclusions[/{header_color}]\n")
-
-        for pattern in sorted(exclusions["user_path"]):
-            output.append(f"- [{highlight_color}]{pattern}[/{highlight_color}]")
-
-        output.append("\n___\n")  # Section divider
-        
-    # User-Defined String Exclusions
-    if exclusions.get("user_string"):
-        output.append(f"[{header_color}]User-Defined String Exclusions[/{header_color}]\n")
-
-        for pattern in sorted(exclusions["user_string"]):
-            output.append(f"- [{highlight_color}]{pattern}[/{highlight_color}]")
-
-        output.append("\n___\n")  # Section divider
-        
-    # If no user exclusions
-    if not exclusions.get("user_path") and not exclusions.get("user_string"):
-        output.append(f"[{header_color}]No current user-added exclusions.[/{header_color}]\n")
+    framework = exclusions_manager.sorted_framework_exclusions()
+    language = exclusions_manager.sorted_language_exclusions()
+
+    # Reuse the rendered output when nothing it depends on has changed
+    cache_key = (
+        framework,
+        language,
+        frozenset(exclusions.get("user_path", ())),
+        frozenset(exclusions.get("user_string", ())),
+        framework_name,
+        language_name,
+        header_color,
+        highlight_color,
+    )
+    rendered = _render_cache.get(cache_key)
+    if rendered is None:
+        rendered = _render_exclusions(
+            framework,
+            language,
+            sorted(exclusions.get("user_path", ())),
+            sorted(exclusions.get("user_string", ())),
+            framework_name,
+            language_name,
+            header_color,
+            highlight_color,
+        )
+        if len(_render_cache) >= _RENDER_CACHE_SIZE:
+            _render_cache.pop(next(iter(_render_cache)))
+        _render_cache[cache_key] = rendered
 
     # Print final output
-    console.print("\n".join(output).strip())
+    console.print(rendered)
 
 def update_exclusions():
     """Manually trigger exclusion updates based on the detected frameworks."""
@@ -107,7 +160,7 @@ def add_exclusion_interactive(exclusion_type="path"):
     """Prompt user to add an exclusion pattern with type."""
     try:
         console.print(f"\n[{theme['input']}]Enter {exclusion_type} exclusion pattern:[/{theme['input']}]")
-        pattern = input().strip()
+        pattern = _read_line().strip()
 
         if not pattern:
             console.print(f"[{theme['warning']}]No pattern entered. Operation cancelled.[/{theme['warning']}]")
@@ -135,7 +188,7 @@ def add_exclusion():
     """Prompt user to choose exclusion type and add a pattern."""
     try:
         console.print(f"\n[{theme['input']}]Exclusion type (1=path, 2=string):[/{theme['input']}]")
-        type_choice = input().strip()
+        type_choice = _read_line().strip()
         
         if not type_choice or type_choice not in ["1", "2"]:
             console.print(f"[{theme['warning']}]Invalid type. Using default (path).[/{theme['warning']}]")
@@ -164,11 +217,12 @@ def remove_exclusion_interactive(exclusion_type="path"):
             return
 
         console.print(f"\n[{theme['highlight']}]User-Added {exclusion_type.capitalize()} Exclusions:[/{theme['highlight']}]")
+        list_item_color = theme['list_item']
         for i, excl in enumerate(sorted(type_exclusions), 1):
-            console.print(f"[{theme['list_item']}]{i}. {excl}[/{theme['list_item']}]")
+            console.print(f"[{list_item_color}]{i}. {excl}[/{list_item_color}]")
 
         console.print(f"\n[{theme['input']}]Enter number to remove (or empty to cancel):[/{theme['input']}]")
-        choice = input().strip()
+        choice = _read_line().strip()
 
         if not choice or not choice.isdigit():
             console.print(f"[{theme['warning']}]Invalid selection. Operation cancelled.[/{theme['warning']}]")
@@ -182,9 +236,9 @@ def remove_exclusion_interactive(exclusion_type="path"):
             return
 
         pattern = exclusion_list[index]
-        exclusions_manager.remove_exclusion(pattern, exclusion_type)
-
-        console.print(f"[{theme['success']}]Successfully removed {exclusion_type} exclusion pattern: [{theme['highlight']}]{pattern}[/{theme['highlight']}]")
+        # Report the removal once, here, rather than also from the manager
+        if exclusions_manager.remove_exclusion(pattern, exclusion_type, verbose=False):
+            console.print(f"[{theme['success']}]Successfully removed {exclusion_type} exclusion pattern: [{theme['highlight']}]{pattern}[/{theme['highlight']}]")
 
         # ✅ Automatically trigger full exclusion update
         handle_exclusion_update(exclusions_manager.base_dir)
@@ -199,7 +253,7 @@ def remove_exclusion():
     """Prompt user to choose which type of exclusion to remove."""
     try:
         console.print(f"\n[{theme['input']}]Exclusion type to remove (1=path, 2=string):[/{theme['input']}]")
-        type_choice = input().strip()
+        type_choice = _read_line().strip()
         
         if not type_choice or type_choice not in ["1", "2"]:
             console.print(f"[{theme['warning']}]Invalid type. Using default (path).[/{theme['warning']}]")
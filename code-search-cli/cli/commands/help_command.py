@@ -1,93 +1,107 @@
 """Help command implementation."""
 
+import functools
+import io
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
 import click
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-
-console = Console()
-
-HELP_TEXT = """
-# Code Search CLI Help
-
-## Interactive REPL Mode
-
-Start the interactive REPL:
-```bash
-code-search repl --base-dir /path/to/search
-```
-In REPL mode:
-- Type search terms directly to search
-- Use `:` prefix for CLI commands (e.g. `: help`)
-- Press Ctrl+C to exit
-
-## Available Commands
-
-### Initialize
-```bash
-: init
-```
-Initialize or change the tool's search directory.
-
-### Search
-Just type your search term in the REPL:
-```bash
->> your search term
-```
-For regex search, use slashes:
-```bash
->> /pattern\\w+/
-```
-For case-insensitive regex search:
-```bash
->> /pattern\\w+/i
-```
-
-### Manage Exclusions
-```bash
-: list           # List all exclusions
-: add "*.pyc"    # Add exclusion pattern
-: rm             # Remove exclusion pattern (interactive)
-```
-
-### Index Management
-```bash
-: index          # Manage search index
-```
-The search index speeds up searches and runs in the background without blocking searches.
-
-### Theme Settings
-```bash
-: theme          # Change between light/dark mode
-```
-
-### Editor Settings
-```bash
-: editor         # Configure your preferred editor for opening files
-: open <number>  # Open a file from search results by its number
-```
-
-## Performance Features
-
-- **Progress Indicators**: Shows search progress in real-time
-- **Background Indexing**: Indexes files without blocking searches
-- **Multithreaded Search**: Utilizes multiple CPU cores for better performance
-- **Smart Exclusions**: Automatically detects and excludes vendor directories
-
-## Tips
-- Use the indexing feature for faster searches in large codebases
-- The index automatically updates when files change
-- Add common build and cache directories to exclusions
-- Use regex for advanced searches
-"""
+
+from cli.console import get_console
+
+# Help text, split into sections by `<!-- topic: name -->` markers
+_HELP_FILE = Path(__file__).parent / "data" / "help.md"
+_TOPIC_MARKER = re.compile(r"^<!-- topic: (\w+) -->\n", re.MULTILINE)
+
+HELP_TITLE = "📚 Code Search CLI Help"
+
+# Fence lines, heading markers and emphasis/code markers
+_MARKDOWN_SYNTAX = re.compile(r"^```\w*\n|^#+ |\*\*|`", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_help() -> Tuple[str, Dict[str, str]]:
+    """Read the help file once; return the full text and the sections by topic."""
+    preamble, *parts = _TOPIC_MARKER.split(_HELP_FILE.read_text(encoding="utf-8"))
+    sections = dict(zip(parts[::2], parts[1::2]))
+    return preamble + "".join(sections.values()), sections
+
+
+def _help_text(topic: Optional[str]) -> str:
+    """Return the Markdown for one topic, or the whole help when topic is None."""
+    help_text, sections = _load_help()
+    return help_text if topic is None else sections[topic]
+
+
+@functools.lru_cache(maxsize=None)
+def _plain_help(topic: Optional[str]) -> bytes:
+    """Help as encoded plain text for pipes and redirects, where Rich styling is wasted."""
+    return _MARKDOWN_SYNTAX.sub("", _help_text(topic)).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _help_markdown(topic: Optional[str]):
+    """Parse a topic's Markdown once; rendering never mutates the parsed tokens."""
+    from rich.markdown import Markdown
+
+    return Markdown(_help_text(topic))
+
+
+# Final encoded output of each topic's help, keyed by (topic, terminal width).
+# This is cached past Rich's Segment stage, so a hit skips layout, styling
+# and encoding and costs a single write.
+_MAX_RENDERED = 4
+_rendered_help: Dict[Tuple[Optional[str], int], bytes] = {}
+
+
+def _render_help(topic: Optional[str], width: int) -> bytes:
+    """Render a topic's help once, escapes included."""
+    from rich.console import Console
+    from rich.rule import Rule
+
+    console = get_console()
+    buffer = io.StringIO()
+    Console(
+        file=buffer,
+        width=width,
+        force_terminal=console.is_terminal,
+        color_system=console.color_system,
+    ).print(Rule(HELP_TITLE, style="green"), _help_markdown(topic))
+    return buffer.getvalue().encode("utf-8")
+
 
 @click.command()
-def show_help():
-    """Show detailed help and usage information."""
-    console.print(
-        Panel(
-            Markdown(HELP_TEXT),
-            title="📚 Code Search CLI Help",
-            border_style="green",
-        )
-    )
+@click.argument("topic", required=False)
+def show_help(topic: Optional[str] = None):
+    """Show detailed help and usage information, optionally for one TOPIC."""
+    if topic is not None:
+        topic = topic.lower()
+        sections = _load_help()[1]
+        if topic not in sections:
+            get_console().print(
+                f"[red]Unknown help topic: {topic}. "
+                f"Choose from: {', '.join(sections)}[/red]"
+            )
+            return
+
+    if not sys.stdout.isatty():
+        output = _plain_help(topic)
+    else:
+        key = (topic, get_console().width)
+        output = _rendered_help.get(key)
+        if output is None:
+            if len(_rendered_help) >= _MAX_RENDERED:
+                del _rendered_help[next(iter(_rendered_help))]
+            output = _rendered_help[key] = _render_help(*key)
+
+    sys.stdout.flush()
+    # Streams swapped in for stdout (CliRunner, REPL capture, IDE consoles)
+    # may not expose a binary buffer
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        buffer.write(output)
+    else:
+        sys.stdout.write(output.decode("utf-8"))
+    sys.stdout.flush()
@@ -1,15 +1,55 @@
 """Initialization command for setting up the code search CLI."""
 
-import click
+import os
+import sys
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
 
-from cli.managers.config_manager import ConfigManager
+import click
+
+from cli.managers.config_manager import get_config_manager
 from ..logger import setup_logger
 
 logger = setup_logger()
-console = Console()
+
+# ANSI styles for the terminal messages; init prints once and exits, so it
+# writes pre-styled strings rather than building Rich renderables
+_GREEN = "\033[32m"
+_YELLOW = "\033[33m"
+_BLUE = "\033[34m"
+_RED = "\033[31m"
+_BOLD = "\033[1m"
+_RESET = "\033[0m"
+
+
+def _write(message: str) -> None:
+    """Write a complete message to stdout in a single call."""
+    sys.stdout.write(message)
+    sys.stdout.flush()
+
+
+def _print_already_initialized(base_dir: str) -> None:
+    """Tell the user a base directory is already configured."""
+    _write(
+        f"{_BOLD}⚠️ Already Initialized{_RESET}\n\n"
+        f"{_YELLOW}Already initialized with base directory:{_RESET}\n"
+        f"{_BLUE}{base_dir}{_RESET}\n\n"
+        f"Use {_GREEN}--force{_RESET} to reinitialize.\n"
+    )
+
+
+def _print_success(base_dir: Path, config_dir: Path) -> None:
+    """Show the initialization summary and the commands to try next."""
+    _write(
+        f"{_BOLD}{_GREEN}🎉 Initialization Complete{_RESET}\n\n"
+        f"{_GREEN}Successfully initialized code search CLI!{_RESET}\n\n"
+        f"Base directory: {_BLUE}{base_dir}{_RESET}\n"
+        f"Config directory: {_BLUE}{config_dir}{_RESET}\n\n"
+        "You can now use the following commands:\n"
+        f"• {_YELLOW}code-search search{_RESET} - Search through your codebase\n"
+        f"• {_YELLOW}code-search exclusions{_RESET} - Manage search exclusions\n"
+        f"• {_YELLOW}code-search help{_RESET} - Show detailed help\n"
+    )
+
 
 @click.command()
 @click.option(
@@ -27,43 +67,39 @@ console = Console()
 )
 def init(base_dir: Path, force: bool):
     """Initialize the code search CLI with a base directory."""
+    # Piped or redirected output gets plain lines without escape codes
+    plain = not sys.stdout.isatty()
     try:
-        config = ConfigManager()
-        current_base_dir = Path(config.get_base_dir())
-
-        if current_base_dir.exists() and not force:
-            console.print(
-                Panel(
-                    f"[yellow]Already initialized with base directory:[/yellow]\n"
-                    f"[blue]{current_base_dir}[/blue]\n\n"
-                    "Use [green]--force[/green] to reinitialize.",
-                    title="⚠️ Already Initialized",
+        config = get_config_manager()
+        current_base_dir = config.get_base_dir()
+
+        if current_base_dir and os.path.exists(current_base_dir) and not force:
+            if plain:
+                print(
+                    f"Already initialized with base directory: {current_base_dir}. "
+                    "Use --force to reinitialize."
                 )
-            )
+            else:
+                _print_already_initialized(current_base_dir)
             return
 
         # Set the new base directory
-        config.set_base_dir(str(base_dir.resolve()))
+        resolved_base_dir = base_dir.resolve()
+        config.set_base_dir(str(resolved_base_dir))
         
         # Log the initialization
-        logger.info(f"Initialized with base directory: {base_dir}")
+        logger.info("Initialized with base directory: {}", resolved_base_dir)
 
         # Display success message
-        console.print(
-            Panel(
-                f"[green]Successfully initialized code search CLI![/green]\n\n"
-                f"Base directory: [blue]{base_dir.resolve()}[/blue]\n"
-                f"Config directory: [blue]{config.config_dir}[/blue]\n\n"
-                "You can now use the following commands:\n"
-                "• [yellow]code-search search[/yellow] - Search through your codebase\n"
-                "• [yellow]code-search exclusions[/yellow] - Manage search exclusions\n"
-                "• [yellow]code-search help[/yellow] - Show detailed help",
-                title="🎉 Initialization Complete",
-                border_style="green",
-            )
-        )
+        if plain:
+            print(f"Successfully initialized code search CLI with base directory: {resolved_base_dir}")
+        else:
+            _print_success(resolved_base_dir, config.config_dir)
 
     except Exception as e:
-        logger.error(f"Initialization failed: {str(e)}")
-        console.print(f"[red]Error: {str(e)}[/red]")
+        logger.error("Initialization failed: {}", e)
+        if plain:
+            print(f"Error: {str(e)}")
+        else:
+            _write(f"{_RED}Error: {str(e)}{_RESET}\n")
         raise click.Abort()
@@ -1,32 +1,49 @@
 """Interactive search command implementation."""
 
 import click
-from rich.console import Console
-from rich.table import Table
+from cli.console import get_console
 from rich.text import Text
-from rich.panel import Panel
-from rich.syntax import Syntax
+import functools
 import os
-import sys
-import traceback
+from collections import defaultdict
 from pathlib import Path
 import re
+from typing import Optional, Pattern
 
-from cli.managers.config_manager import ConfigManager
+from cli.managers.config_manager import get_config_manager
 from cli.managers.search_engine import SearchEngine
 from cli.managers.theme_manager import ThemeManager
 from cli.logger import setup_logger
 
 logger = setup_logger()
-console = Console()
+console = get_console()
 
-def format_search_results(results, query, theme=None):
+# Search terms refused outright because they name directories that are always excluded
+CORE_EXCLUDED_TERMS = frozenset({"vendor", "node_modules", ".git"})
+
+@functools.lru_cache(maxsize=64)
+def _compile(pattern: str, flags: int = 0) -> Pattern:
+    """Compile a regex once; exclusion patterns repeat across searches."""
+    return re.compile(pattern, flags)
+
+def _query_regex(query: str, use_regex: bool, case_sensitive: bool) -> Optional[Pattern]:
+    """Compile the query the way the search engine matched it, for highlighting.
+    
+    Returns None if Python's re cannot compile a regex that ripgrep accepted.
+    """
+    try:
+        return _compile(query if use_regex else re.escape(query), 0 if case_sensitive else re.IGNORECASE)
+    except re.error:
+        return None
+
+def format_search_results(results, query, theme=None, query_re=None):
     """Format search results for display.
     
     Args:
         results: List of SearchResult objects
         query: The search query
         theme: Theme dictionary for styling
+        query_re: Compiled query used to find the matches to highlight in each line
         
     Returns:
         Formatted rich Text object
@@ -35,90 +52,87 @@ def format_search_results(results, query, theme=None):
         if not theme:
             theme = ThemeManager.get_theme()
         
-        # Add debugging
-        print(f"format_search_results called with {len(results)} results for: {query}")
-        
         # Early return for empty results to avoid confusion
         if not results:
-            print("Warning: Empty results list")
             return Text(f"No results found for: {query}", style=theme['warning'])
         
-        # Skip additional filtering - our main search already applies filters
-        filtered_results = results
-        
-        # Group results by file
-        files = {}
-        for result in filtered_results:
-            # Debug individual results
-            print(f"Processing result: {result.file_path}:{result.line_number}")
-            
-            if result.file_path not in files:
-                files[result.file_path] = []
-            files[result.file_path].append(result)
-        
-        # Build output with rich Text objects
-        output = Text()
-        output.append(f"Found {len(filtered_results)} matches in {len(files)} files\n\n", style=theme['highlight'])
+        # Group results by file, keyed by the path string
+        files = defaultdict(list)
+        for result in results:
+            files[os.fspath(result.file_path)].append(result)
         
-        # Emergency fallback for debugging - simple text output in case rich formatting fails
-        print(f"RESULTS: Found {len(filtered_results)} matches in {len(files)} files")
+        # Collect (text, style) parts and build the rich Text once at the end
+        match_style = f"bold {theme['error']}"
+        cwd = os.getcwd()
+        cwd_prefix = os.path.join(cwd, "")
+        parts = [(f"Found {len(results)} matches in {len(files)} files\n\n", theme['highlight'])]
         
         for file_path, file_results in files.items():
-            # Add file header
-            rel_path = os.path.relpath(file_path)
-            output.append(f"{rel_path}\n", style=theme['success'])
-            print(f"FILE: {rel_path}")
+            # Add file header, relative to the working directory; paths under it
+            # only need their prefix sliced off
+            if file_path.startswith(cwd_prefix):
+                rel_path = file_path[len(cwd_prefix):]
+            else:
+                rel_path = os.path.relpath(file_path, cwd)
+            parts.append((f"{rel_path}\n", theme['success']))
             
             # Add each matching line
             for result in file_results:
                 try:
-                    line_text = Text()
-                    
-                    # Add line number
-                    line_text.append(f"{result.line_number}:", style=theme['highlight'])
-                    print(f"  LINE {result.line_number}: {result.line_content[:80].strip()}")
+                    # Indent and line number
+                    line_parts = ["  ", (f"{result.line_number}:", theme['highlight'])]
                     
                     # Add line content with highlighted matches
                     content = result.line_content
                     
-                    # Handle case when there are no match positions
-                    if not result.match_positions:
-                        # Safely handle missing match positions
-                        line_text.append(f" {content}", style=theme['text'])
+                    # Find the matches on the fly; results only carry positions
+                    # when the caller computed them itself
+                    if query_re is not None:
+                        spans = (m.span() for m in query_re.finditer(content))
                     else:
-                        last_end = 0
+                        spans = result.match_positions or ()
+                    
+                    last_end = 0
+                    for start, end in spans:
+                        if start == end:
+                            # Empty regex match; nothing to highlight
+                            continue
                         
-                        for start, end in result.match_positions:
-                            # Add text before match
-                            if start > last_end:
-                                line_text.append(content[last_end:start])
-                            
-                            # Add highlighted match
-                            line_text.append(content[start:end], style=f"bold {theme['error']}")
-                            last_end = end
+                        # Add text before match
+                        if start > last_end:
+                            line_parts.append(content[last_end:start])
                         
+                        # Add highlighted match
+                        line_parts.append((content[start:end], match_style))
+                        last_end = end
+                    
+                    if last_end == 0:
+                        # No match positions to highlight
+                        line_parts.append((f" {content}", theme['text']))
+                    elif last_end < len(content):
                         # Add any remaining text after the last match
-                        if last_end < len(content):
-                            line_text.append(content[last_end:])
+                        line_parts.append(content[last_end:])
                     
                     # Add the formatted line to output
-                    output.append("  ")
-                    output.append(line_text)
-                    output.append("\n")
+                    line_parts.append("\n")
+                    parts.extend(line_parts)
                 except Exception as e:
                     # Fallback for individual result formatting errors
-                    print(f"Error formatting result: {str(e)}")
-                    output.append(f"  {result.line_number}: {result.line_content}\n")
+                    logger.debug("Error formatting result {}:{}: {}", result.file_path, result.line_number, e)
+                    parts.append(f"  {result.line_number}: {result.line_content}\n")
             
             # Add separator between files
-            output.append("\n")
+            parts.append("\n")
         
-        return output
+        # Close with the summary so the caller can print everything in one write
+        parts.append((f"Found {len(results)} matches in {len(files)} files", theme['success']))
+        
+        return Text.assemble(*parts)
         
     except Exception as e:
         # Critical error - fall back to simple text
-        print(f"CRITICAL ERROR in format_search_results: {str(e)}")
-        print(traceback.format_exc())
+        import traceback
+        logger.error("format_search_results failed: {}\n{}", e, traceback.format_exc())
         error_text = Text()
         error_text.append(f"Found {len(results)} results for '{query}'\n", style="bold")
         error_text.append("Error formatting results. See below for raw output:\n\n")
@@ -135,8 +149,10 @@ def interactive_search(base_dir: Path):
     console.print(f"\n[{theme['highlight']}]Code Search CLI[/{theme['highlight']}] - Interactive Mode")
     console.print(f"Type your search term and press Enter. Press [{theme['error']}]Ctrl+C[/{theme['error']}] to exit.\n")
     
-    config = ConfigManager()
+    # Built once for the whole session; the engine owns the exclusions manager
+    config = get_config_manager()
     search_engine = SearchEngine(base_dir, config)
+    exclusions_manager = search_engine.exclusions_manager
 
     while True:
         try:
@@ -146,26 +162,14 @@ def interactive_search(base_dir: Path):
                 continue  # Skip empty inputs
                 
             # Check if the search term is an excluded directory
-            # Get all exclusion patterns from configuration
-            config = ConfigManager()
-            exclusions_manager = ExclusionsManager(str(base_dir), config)
-            exclusions = exclusions_manager.get_combined_exclusions()
-            
-            # Collect all excluded terms
-            excluded_terms = set()
-            for category in exclusions.values():
-                for pattern in category:
-                    # Convert glob patterns to simple terms
-                    term = pattern.rstrip('/*').rstrip('/').lstrip('*').lstrip('.')
-                    if term and len(term) > 2:  # Only add meaningful terms
-                        excluded_terms.add(term.lower())
-            
             # Only block core excluded terms - don't over-block
-            core_excluded = {"vendor", "node_modules", ".git"}
-            if search_term.lower() in core_excluded:
+            if search_term.lower() in CORE_EXCLUDED_TERMS:
                 console.print(f"[{theme['warning']}]'{search_term}' is excluded from searches as it typically refers to directories that are excluded by your settings.[/{theme['warning']}]")
                 continue
 
+            # Exclusion regexes for this query; the engine applies them during the scan
+            exclusion_regex = exclusions_manager.generate_search_exclusion_regex()
+
             # Show a status while searching
             with console.status(f"[{theme['highlight']}]Searching for: {search_term}[/{theme['highlight']}]") as status:
                 # Determine if this is a regex search (starts with / and ends with /)
@@ -189,105 +193,24 @@ def interactive_search(base_dir: Path):
                         case_sensitive, 
                         wait_for_index=False,
                         max_results=100,
-                        timeout=30
+                        timeout=30,
+                        exclusion_regex=exclusion_regex
                     )
                 except TimeoutError:
                     # Prevent search from hanging
                     status.update("[red]Search timed out. Try a more specific query.[/red]")
                     results = []
                 
-                # Use the exclusions from the config
-                # Get exclusion patterns from the configuration - use new exclusion structure
-                exclusions = search_engine.exclusions_manager.get_combined_exclusions()
-                
-                # Get only path exclusions for filtering file paths
-                path_patterns = set()
-                if "language" in exclusions:
-                    path_patterns.update(exclusions["language"])
-                if "framework" in exclusions:
-                    path_patterns.update(exclusions["framework"])
-                if "user_path" in exclusions:
-                    path_patterns.update(exclusions["user_path"])
-                
-                # Get string exclusions for filtering content
-                string_patterns = set()
-                if "user_string" in exclusions:
-                    string_patterns.update(exclusions["user_string"])
-                
-                # Filter results using configured exclusions, but ensure we're not excluding everything
-                filtered_results = results.copy()
-                
-                # First apply path exclusions
-                if path_patterns and results:
-                    # Debug the filtering process - save original count
-                    original_count = len(filtered_results)
-                    
-                    # Only exclude paths that contain the exclusion pattern as a directory component
-                    # For example, 'vendor' should match '/vendor/' or '/vendor' but not 'vendorName'
-                    for result in results[:]:
-                        path_str = str(result.file_path)
-                        path_parts = path_str.split('/')
-                        
-                        # Check each pattern against complete path
-                        for pattern in path_patterns:
-                            # Skip very short patterns that might cause over-exclusion
-                            if len(pattern) <= 2:
-                                continue
-                                
-                            # Only exclude if pattern matches a complete path segment
-                            if pattern in path_parts or f"/{pattern}" in path_str or f"{pattern}/" in path_str:
-                                if result in filtered_results:
-                                    filtered_results.remove(result)
-                                break
-                    
-                    # If we've excluded everything, go back to the original results
-                    # This is a safety check to prevent over-filtering
-                    if not filtered_results and original_count > 0:
-                        filtered_results = results.copy()
-                
-                # Now apply string exclusions to content if any exist
-                if string_patterns and filtered_results:
-                    # Save original count
-                    original_count = len(filtered_results)
-                    
-                    # Filter out results with matching content exclusions
-                    for result in filtered_results[:]:
-                        line_content = result.line_content
-                        
-                        # Check each string pattern against the line content
-                        for pattern in string_patterns:
-                            if pattern in line_content:
-                                if result in filtered_results:
-                                    filtered_results.remove(result)
-                                break
-                    
-                    # If we've excluded everything, revert to previous results
-                    if not filtered_results and original_count > 0:
-                        filtered_results = results.copy()
-                        
-                # Make sure we never return an empty list if there were results
-                if not filtered_results and results:
-                    filtered_results = results.copy()
-                
                 # Update status when search completes
-                status.update(f"[{theme['success']}]Found {len(filtered_results)} results for: {search_term}[/{theme['success']}]")
+                status.update(f"[{theme['success']}]Found {len(results)} results for: {search_term}[/{theme['success']}]")
                 
                 # Format the results for display
-                formatted_results = format_search_results(filtered_results, search_term, theme)
+                query_re = _query_regex(search_term, use_regex, case_sensitive)
+                formatted_results = format_search_results(results, search_term, theme, query_re)
                 
-            # Display results after search is complete (outside status context)
-            console.print(formatted_results)
-            
-            # Print a summary if we got results
-            if filtered_results:
-                file_count = len(set(r.file_path for r in filtered_results))
-                console.print(f"[{theme['success']}]Found {len(filtered_results)} matches in {file_count} files[/{theme['success']}]")
-            else:
-                # Make sure we always show feedback
-                console.print(f"[{theme['warning']}]No matches found for: {search_term}[/{theme['warning']}]")
-                
-            # IMPORTANT - add a blank line to separate from next prompt
-            console.print("")
+            # Display results, summary included, after search is complete (outside
+            # status context), with a blank line to separate them from the next prompt
+            console.print(formatted_results, end="\n\n")
 
         except KeyboardInterrupt:
             console.print(f"\n[{theme['success']}]Exiting Code Search CLI.[/{theme['success']}]")
@@ -318,7 +241,7 @@ def interactive_search(base_dir: Path):
 def search(base_dir: Path = None, query: str = None, regex: bool = False, ignore_case: bool = False):
     """Search through the codebase. If no query is provided, enters interactive mode."""
     try:
-        config = ConfigManager()
+        config = get_config_manager()
         theme = ThemeManager.get_theme()
         search_dir = base_dir or Path(config.get_base_dir())
         
@@ -333,26 +256,13 @@ def search(base_dir: Path = None, query: str = None, regex: bool = False, ignore
 
         # Single search mode using the search engine
         search_engine = SearchEngine(search_dir, config)
-        results = search_engine.search(query, regex, not ignore_case)
-        
-        # Apply exclusions from config, not hardcoded values
-        exclusions_manager = ExclusionsManager(str(search_dir), config)
-        exclusion_patterns = exclusions_manager.generate_search_exclusion_regex()
-        path_pattern = exclusion_patterns.get("path", "(?!)")
-        
-        # Filter results based on path exclusions from config
-        if path_pattern and path_pattern != "(?!)":
-            try:
-                path_regex = re.compile(path_pattern)
-                filtered_results = [r for r in results if not path_regex.search(str(r.file_path))]
-            except:
-                # If regex fails, use original results
-                filtered_results = results
-        else:
-            filtered_results = results
+        # Apply exclusions from config, not hardcoded values, during the scan
+        exclusion_regex = search_engine.exclusions_manager.generate_search_exclusion_regex()
+        results = search_engine.search(query, regex, not ignore_case, exclusion_regex=exclusion_regex)
         
         # Display the results
-        formatted_results = format_search_results(filtered_results, query, theme)
+        query_re = _query_regex(query, regex, not ignore_case)
+        formatted_results = format_search_results(results, query, theme, query_re)
         console.print(formatted_results)
 
     except Exception as e:
@@ -0,0 +1,23 @@
+"""Shared Rich console for the code search CLI."""
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Optional["Console"] = None
+
+
+def get_console() -> "Console":
+    """Return the CLI-wide console, creating it on first use.
+
+    Every module prints through this one instance, so the terminal is probed
+    once per process. Rich is imported here, on first call, so code paths
+    that never print through Rich do not pay for importing it.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
@@ -1,33 +1,73 @@
 """Logging configuration for the code search CLI."""
 
+import logging
+import logging.handlers
 import sys
 from pathlib import Path
 
-from loguru import logger
+_logger = None
+
+class BraceStyleLogger:
+    """Thin wrapper giving a stdlib logger loguru's "{}" message formatting.
+
+    Arguments are only formatted into the message when its level is enabled.
+    """
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    def _log(self, level: int, message: str, args: tuple, kwargs: dict) -> None:
+        if self._logger.isEnabledFor(level):
+            if args or kwargs:
+                message = message.format(*args, **kwargs)
+            self._logger.log(level, message)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.DEBUG, message, args, kwargs)
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.INFO, message, args, kwargs)
+
+    def warning(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.WARNING, message, args, kwargs)
+
+    def error(self, message: str, *args, **kwargs) -> None:
+        self._log(logging.ERROR, message, args, kwargs)
 
 def setup_logger():
-    """Configure and return the logger instance."""
-    # Remove default handler
-    logger.remove()
+    """Configure and return the logger instance.
+
+    Handlers are added on the first call only; later calls return the same
+    configured logger.
+    """
+    global _logger
+    if _logger is not None:
+        return _logger
+
+    logger = logging.getLogger("codesearch")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
     # Add console handler for warnings and errors
-    logger.add(
-        sys.stderr,
-        format="<level>{level}</level> | {message}",
-        level="WARNING",
-        colorize=True,
-    )
+    console_handler = logging.StreamHandler(sys.stderr)
+    console_handler.setLevel(logging.WARNING)
+    console_handler.setFormatter(logging.Formatter("%(levelname)s | %(message)s"))
+    logger.addHandler(console_handler)
 
     # Add file handler for all levels
     log_file = Path("logs/search_audit.log")
     log_file.parent.mkdir(parents=True, exist_ok=True)
-    
-    logger.add(
+
+    file_handler = logging.handlers.RotatingFileHandler(
         log_file,
-        format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
-        level="INFO",
-        rotation="10 MB",
-        retention="1 month",
+        maxBytes=10 * 1024 * 1024,
+        backupCount=4,
+    )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(
+        logging.Formatter("%(asctime)s | %(levelname)s | %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
     )
+    logger.addHandler(file_handler)
 
-    return logger
+    _logger = BraceStyleLogger(logger)
+    return _logger
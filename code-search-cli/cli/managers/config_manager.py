@@ -1,19 +1,73 @@
 """Configuration management for the code search CLI."""
 
+import bisect
+import copy
+import functools
 import os
 import re
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-import yaml
-from dotenv import load_dotenv
-from rich.console import Console
+from cli.console import get_console
 from cli.managers.theme_manager import ThemeManager
 from cli.managers.exclusions_updater import handle_exclusion_update
 
-console = Console()
-global theme
-theme = ThemeManager.get_theme()
+
+# settings.yaml key holding the base directory mtime at the last exclusion scan
+EXCLUSION_SCAN_KEY = "last_exclusion_scan_mtime_ns"
+
+# settings.yaml keys holding the base directory the detected frameworks were
+# read from, and its mtime at the time
+DETECTED_IN_KEY = "detected_in_dir"
+DETECTED_AT_KEY = "detected_at_mtime"
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_codecs():
+    """Import PyYAML on first use and return (yaml, loader, dumper).
+
+    Prefers the libyaml-backed C loader/dumper when PyYAML was built with it.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as dumper, CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeDumper as dumper, SafeLoader as loader
+    return yaml, loader, dumper
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Dict:
+    """Parse a YAML file, shared by every ConfigManager in the process.
+
+    The mtime and size are only part of the cache key, so an edited file is
+    a cache miss. The raw bytes go straight to the loader, which decodes
+    them itself, skipping the text I/O layer.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size)
+    finally:
+        os.close(fd)
+    yaml, loader, _ = _yaml_codecs()
+    return yaml.load(data, Loader=loader) or {}
+
+
+def _sort_exclusions(config: Dict) -> None:
+    """Sort and dedupe the stored exclusion lists in place.
+
+    add_exclusion and remove_exclusion binary-search these lists, but files
+    written by older versions or edited by hand may hold them unsorted.
+    """
+    exclusions = config.get("exclusions")
+    if not isinstance(exclusions, dict):
+        return
+    for key, patterns in exclusions.items():
+        if isinstance(patterns, list):
+            exclusions[key] = sorted(set(map(str, patterns)))
+
 
 class ConfigManager:
     """Manages configuration for the code search CLI."""
@@ -24,6 +78,13 @@ class ConfigManager:
         self.config_dir = self.app_root / "config"
         self.config_file = self.config_dir / "settings.yaml"
         self.env_file = self.config_dir / ".env"
+        # mtime of settings.yaml at our last load or save, and the dict it held
+        self._mtime_ns: Optional[int] = None
+        self._loaded_config: Optional[Dict] = None
+        # Inside batch(), save_config only records the config to write on exit
+        self._in_batch = False
+        self._dirty = False
+        self._pending_config: Optional[Dict] = None
 
         # ✅ Ensure the config directory exists
         self._ensure_config_dir()
@@ -31,48 +92,150 @@ class ConfigManager:
 
         # ✅ If settings.yaml is missing or base_dir is empty, force setup
         if not self.config or not self.config.get("base_dir"):
-            console.print(
+            get_console().print(
                 f"First-time setup required."
             )
             self._first_time_setup()
-        else:
-            # ✅ Ensure exclusions are properly set up even after initialization
-            handle_exclusion_update(self.config["base_dir"], self)
+        elif self._exclusion_scan_needed(self.config["base_dir"]):
+            # ✅ Ensure exclusions are properly set up even after initialization;
+            # skipped while the base directory is unchanged since the last scan
+            self._update_exclusions(self.config["base_dir"])
+
+    def _base_dir_mtime_ns(self, base_dir: str) -> Optional[int]:
+        """Return the base directory's mtime, or None if it cannot be read.
+
+        Framework detection only looks at the directory's own entries, so an
+        unchanged mtime means a new exclusion scan would find the same thing.
+        """
+        try:
+            return Path(base_dir).stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _exclusion_scan_needed(self, base_dir: str) -> bool:
+        """Check whether the base directory changed since the last exclusion scan."""
+        mtime_ns = self._base_dir_mtime_ns(base_dir)
+        return mtime_ns is None or self.config.get(EXCLUSION_SCAN_KEY) != mtime_ns
+
+    def _update_exclusions(self, base_dir: str) -> None:
+        """Rescan the base directory for exclusions and record when it was scanned."""
+        scan_mtime_ns = self._base_dir_mtime_ns(base_dir)
+        with self.batch():
+            handle_exclusion_update(base_dir, self)
+            self.config[EXCLUSION_SCAN_KEY] = scan_mtime_ns
+            self.save_config(self.config)
 
     def _ensure_config_dir(self) -> None:
         """Ensure the configuration directory exists."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
         if self.env_file.exists():
+            from dotenv import load_dotenv
+
             load_dotenv(self.env_file)
 
     def _load_config(self) -> Dict:
-        """Load the configuration from file. If missing, return an empty dict."""
-        if not self.config_file.exists():
+        """Load the configuration from file. If missing, return an empty dict.
+
+        The file is only parsed again when its mtime differs from our last
+        load or save of it, and other instances reuse the same parse.
+        """
+        if self._dirty:
+            # A batch has a newer config than the file
+            return self._pending_config
+
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
             self.save_config({})
             return {}
 
+        if stat.st_mtime_ns == self._mtime_ns and self._loaded_config is not None:
+            return self._loaded_config
+
         try:
-            with open(self.config_file, "r") as f:
-                return yaml.safe_load(f) or {}
+            # The parse is shared; copy it so this instance's edits stay its own
+            parsed = _load_yaml_cached(str(self.config_file), stat.st_mtime_ns, stat.st_size)
+            self._loaded_config = copy.deepcopy(parsed)
+            _sort_exclusions(self._loaded_config)
+            self._mtime_ns = stat.st_mtime_ns
+            return self._loaded_config
         except Exception as e:
-            console.print(f"[red]Failed to load config: {str(e)}[/red]")
+            get_console().print(f"[red]Failed to load config: {str(e)}[/red]")
             return {}
 
+    def state_token(self) -> Optional[int]:
+        """Return the settings.yaml mtime at our last load or save.
+
+        None while a batch holds unsaved changes, or before the file was read,
+        since the in-memory config may then differ from any file state.
+        """
+        return None if self._dirty else self._mtime_ns
+
     def save_config(self, config: Dict) -> None:
-        """Save the configuration to file."""
+        """Save the configuration to file, or on exit when inside batch()."""
+        self._pending_config = config
+        self._dirty = True
+        if not self._in_batch:
+            self._flush()
+
+    @contextmanager
+    def batch(self):
+        """Coalesce every save_config call in the block into one write on exit."""
+        if self._in_batch:
+            # Nested batch; the outermost one writes
+            yield
+            return
+
+        self._in_batch = True
+        try:
+            yield
+        finally:
+            self._in_batch = False
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the pending config, if any, to disk unless the file already holds it."""
+        if not self._dirty:
+            return
+
+        config = self._pending_config
+        self._dirty = False
+        self._pending_config = None
         try:
-            with open(self.config_file, "w") as f:
-                yaml.dump(config, f)
+            yaml, _, dumper = _yaml_codecs()
+            data = yaml.dump(config, Dumper=dumper, encoding="utf-8")
+            try:
+                unchanged = self.config_file.read_bytes() == data
+            except FileNotFoundError:
+                unchanged = False
+
+            if not unchanged:
+                # Write a temporary file and rename it over settings.yaml, so a
+                # crash never leaves a truncated config behind
+                tmp_file = self.config_file.with_suffix(".yaml.tmp")
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+                os.replace(tmp_file, self.config_file)
+                _load_yaml_cached.cache_clear()
+
+            self._mtime_ns = self.config_file.stat().st_mtime_ns
+            self._loaded_config = config
             # Don't print success message to avoid cluttering the output
         except Exception as e:
-            console.print(f"[{theme['error']}]Failed to save config: {str(e)}[/]")
+            theme = ThemeManager.get_theme()
+            get_console().print(f"[{theme['error']}]Failed to save config: {str(e)}[/]")
 
 
     def _first_time_setup(self):
         """Prompt the user to set up the application on first launch."""
+        theme = ThemeManager.get_theme()
         try:
-            theme = ThemeManager.get_theme()
-            console.print(f"\nIt looks like you're starting Code Search CLI for the first time. [{theme['highlight']}]Let's set things up![/{theme['highlight']}]")
+            get_console().print(f"\nIt looks like you're starting Code Search CLI for the first time. [{theme['highlight']}]Let's set things up![/{theme['highlight']}]")
 
             base_dir = self._prompt_for_directory()
             selected_theme = self._prompt_for_theme()
@@ -89,24 +252,25 @@ class ConfigManager:
                 "theme": selected_theme,
                 "editor": preferred_editor
             }
-            self.save_config(self.config)
-            handle_exclusion_update(self.config["base_dir"], self)
+            with self.batch():
+                self.save_config(self.config)
+                self._update_exclusions(self.config["base_dir"])
 
-            console.print(f"\nSetup complete! Code Search CLI is now ready to use.\n")
+            get_console().print(f"\nSetup complete! Code Search CLI is now ready to use.\n")
         except KeyboardInterrupt:
-            console.print(f"\n[{theme['error']}]Setup interrupted. Exiting...[/]")
+            get_console().print(f"\n[{theme['error']}]Setup interrupted. Exiting...[/]")
             raise SystemExit(1)
             
     def _prompt_for_editor(self) -> dict:
         """Prompt the user for their preferred editor/IDE."""
-        console.print("\nWhat editor/IDE would you like to use for opening files?")
-        console.print("[1] Visual Studio Code (code)")
-        console.print("[2] JetBrains IDEs (IntelliJ, PyCharm, etc.)")
-        console.print("[3] Sublime Text")
-        console.print("[4] Vim")
-        console.print("[5] Emacs")
-        console.print("[6] Use system default")
-        console.print("[7] Custom command")
+        get_console().print("\nWhat editor/IDE would you like to use for opening files?")
+        get_console().print("[1] Visual Studio Code (code)")
+        get_console().print("[2] JetBrains IDEs (IntelliJ, PyCharm, etc.)")
+        get_console().print("[3] Sublime Text")
+        get_console().print("[4] Vim")
+        get_console().print("[5] Emacs")
+        get_console().print("[6] Use system default")
+        get_console().print("[7] Custom command")
         
         choice = input("Enter your choice (1-7): ").strip() or "1"
         
@@ -129,20 +293,21 @@ class ConfigManager:
 
     def _prompt_for_directory(self) -> str:
         """Prompt the user for the codebase root directory."""
+        theme = ThemeManager.get_theme()
         while True:
-            console.print(f"\nEnter the directory where your codebase is located: ", end="")
+            get_console().print(f"\nEnter the directory where your codebase is located: ", end="")
             base_dir = input().strip()
             base_dir = re.sub(r"^\x1b\[200~|\x1b\[201~$", "", base_dir).strip()
 
             if Path(base_dir).exists():
                 return base_dir
-            console.print(f"[{theme['error']}]Invalid directory path. Please enter a valid path.[/]")
+            get_console().print(f"[{theme['error']}]Invalid directory path. Please enter a valid path.[/]")
 
     def _prompt_for_theme(self) -> str:
         """Prompt the user for the CLI theme preference."""
-        console.print("\nSelect a theme:")
-        console.print("[1] Light Mode")
-        console.print("[2] Dark Mode")
+        get_console().print("\nSelect a theme:")
+        get_console().print("[1] Light Mode")
+        get_console().print("[2] Dark Mode")
 
         theme_choice = input("Enter your choice (1 or 2): ").strip() or "1"
         return "light" if theme_choice == "1" else "dark"
@@ -154,8 +319,9 @@ class ConfigManager:
     def set_base_dir(self, base_dir: str) -> None:
         """Set the base directory for code search."""
         self.config["base_dir"] = str(Path(base_dir).resolve())
-        self.save_config(self.config)
-        handle_exclusion_update(base_dir, self)
+        with self.batch():
+            self.save_config(self.config)
+            self._update_exclusions(base_dir)
         
     def get_editor_config(self) -> dict:
         """Get the configured editor settings."""
@@ -171,9 +337,24 @@ class ConfigManager:
         """Get detected frameworks from config."""
         return self.config.get("detected_frameworks", [])
 
-    def update_frameworks(self, frameworks: List[str]) -> None:
-        """Update detected frameworks in the config."""
+    def get_frameworks_detected_at(self) -> Optional[Tuple[str, int]]:
+        """Get the (base directory, mtime_ns) the stored frameworks were detected at."""
+        base_dir = self.config.get(DETECTED_IN_KEY)
+        mtime_ns = self.config.get(DETECTED_AT_KEY)
+        if base_dir is None or mtime_ns is None:
+            return None
+        return base_dir, mtime_ns
+
+    def update_frameworks(self, frameworks: List[str], detected_at: Optional[Tuple[str, int]] = None) -> None:
+        """Update detected frameworks in the config.
+        
+        Args:
+            frameworks: Detected frameworks
+            detected_at: Resolved base directory and its mtime_ns when they
+                were detected
+        """
         self.config["detected_frameworks"] = sorted(frameworks)
+        self.config[DETECTED_IN_KEY], self.config[DETECTED_AT_KEY] = detected_at or (None, None)
         self.save_config(self.config)
 
     def set_exclusions(self, exclusions: Dict[str, List[str]]):
@@ -234,7 +415,11 @@ class ConfigManager:
 
 
     def add_exclusion(self, pattern: str, exclusion_type: str = "path") -> None:
-        """Add a user-defined exclusion pattern of the specified type."""
+        """Add a user-defined exclusion pattern of the specified type.
+
+        The stored lists are kept sorted, so the pattern is inserted in place
+        by binary search instead of re-sorting the list on save.
+        """
         exclusions = self.get_exclusions()
         
         # Map type to config key
@@ -243,8 +428,10 @@ class ConfigManager:
         if type_key not in exclusions:
             exclusions[type_key] = []
             
-        if pattern not in exclusions[type_key]:
-            exclusions[type_key].append(pattern)
+        patterns = exclusions[type_key]
+        index = bisect.bisect_left(patterns, pattern)
+        if index == len(patterns) or patterns[index] != pattern:
+            patterns.insert(index, pattern)
             
         # Update config
         self.set_exclusions(exclusions)
@@ -256,8 +443,32 @@ class ConfigManager:
         # Map type to config key
         type_key = f"user_{exclusion_type}"
         
-        if type_key in exclusions and pattern in exclusions[type_key]:
-            exclusions[type_key].remove(pattern)
+        patterns = exclusions.get(type_key, [])
+        index = bisect.bisect_left(patterns, pattern)
+        if index < len(patterns) and patterns[index] == pattern:
+            del patterns[index]
             
         # Update config
         self.set_exclusions(exclusions)
+
+
+_shared_config: Optional[ConfigManager] = None
+
+
+def get_config_manager() -> ConfigManager:
+    """Return a shared ConfigManager, rebuilt only when settings.yaml changed on disk.
+
+    The manager records the mtime of every load and save it performs, so its
+    own writes never count as a change; only edits from another process do.
+    """
+    global _shared_config
+    if _shared_config is not None:
+        try:
+            mtime_ns = _shared_config.config_file.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is not None and mtime_ns == _shared_config._mtime_ns:
+            return _shared_config
+
+    _shared_config = ConfigManager()
+    return _shared_config
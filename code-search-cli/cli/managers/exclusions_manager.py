@@ -1,48 +1,278 @@
+import fnmatch
+import functools
+import io
 import os
 import re
-from pathlib import Path
-from typing import List, Dict, Set
+from pathlib import Path, PurePath
+from typing import FrozenSet, Iterable, List, Dict, Optional, Pattern, Set, Tuple
 from cli.managers.config_manager import ConfigManager
 from cli.managers.theme_manager import ThemeManager
-from rich.console import Console
+from cli.console import get_console
 
-console = Console()
+
+_GLOB_CHARS = frozenset("*?[")
+
+# detect_codebase_type results keyed by (base directory, its mtime_ns), so
+# every ExclusionsManager in one run shares a single directory listing
+_detected_frameworks_cache: Dict[Tuple[str, int], frozenset] = {}
+
+def _unanchored_glob(pattern: str) -> str:
+    """Translate a glob to a regex with fnmatch, without its end-of-string anchor."""
+    translated = fnmatch.translate(pattern)
+    return translated[:-2] if translated.endswith("\\Z") else translated
+
+# Files in the base directory that mark a language; entries starting with
+# "." are extensions
+_LANGUAGE_SIGNATURES: Dict[str, Tuple[str, ...]] = {
+    "PHP": ("composer.json",),
+    "JavaScript": ("package.json",),
+    "Python": ("requirements.txt", "setup.py", "Pipfile", "__init__.py"),
+    "Java": ("pom.xml", "build.gradle"),
+    "Go": ("go.mod", "main.go"),
+    "Rust": ("Cargo.toml",),
+    "C++": ("CMakeLists.txt", ".cpp", ".h"),
+    "C#": (".csproj", "Program.cs"),
+    "Ruby": ("Gemfile",),
+}
+
+def _index_signatures(extensions: bool) -> Dict[str, Tuple[str, ...]]:
+    """Invert _LANGUAGE_SIGNATURES into signature -> languages, for names or for extensions."""
+    index: Dict[str, Tuple[str, ...]] = {}
+    for language, signatures in _LANGUAGE_SIGNATURES.items():
+        for signature in signatures:
+            if not extensions or signature.startswith("."):
+                index[signature] = index.get(signature, ()) + (language,)
+    return index
+
+_SIG_TO_LANG = _index_signatures(extensions=False)
+_EXT_TO_LANG = _index_signatures(extensions=True)
+
+def normalize_path_pattern(pattern: str) -> str:
+    """Normalize a path exclusion pattern so equivalent spellings collapse to one.
+    
+    Surrounding whitespace, leading "./" and trailing "/" are dropped; a bare
+    name already excludes the directory, so "node_modules/" and
+    "./node_modules" both become "node_modules".
+    """
+    pattern = pattern.strip()
+    while pattern.startswith("./"):
+        pattern = pattern[2:]
+    return pattern.rstrip("/")
+
+class ExclusionTrie:
+    """Multi-segment path exclusions, such as "vendor/bundle", as a trie of literal segments.
+    
+    Each node is reached by the pattern's leading literal segments; a
+    pattern that ends there marks it terminal, and one that continues with
+    a glob leaves that glob on the node, matched against the rest of the
+    path or one of its parent directories.
+    """
+
+    def __init__(self):
+        self.children: Dict[str, "ExclusionTrie"] = {}
+        self.globs: List[Pattern] = []
+        self.is_terminal = False
+
+    def add(self, pattern: str) -> None:
+        """Add a pattern, relative to the base directory, whose first segment is literal.
+        
+        Args:
+            pattern: Path exclusion pattern
+        """
+        node = self
+        segments = pattern.split('/')
+        for i, segment in enumerate(segments):
+            if not _GLOB_CHARS.isdisjoint(segment):
+                # fnmatch's "*" also matches "/", so the rest stays one glob;
+                # it may stop at any component boundary, so a match of a
+                # parent directory excludes everything below it
+                glob = _unanchored_glob('/'.join(segments[i:]))
+                node.globs.append(re.compile(rf"{glob}(?:/.*)?\Z", re.DOTALL))
+                return
+            node = node.children.setdefault(segment, ExclusionTrie())
+        node.is_terminal = True
+
+    def is_excluded(self, path_parts: Tuple[str, ...]) -> bool:
+        """Descend the trie along a path's components.
+        
+        Args:
+            path_parts: Components of a path relative to the base directory
+            
+        Returns:
+            True if a pattern matches the path or one of its parent directories
+        """
+        node = self
+        # Joined once; each node's globs match from the current component's offset
+        path = '/'.join(path_parts)
+        offset = 0
+        for part in path_parts:
+            for glob in node.globs:
+                if glob.match(path, offset):
+                    return True
+            offset += len(part) + 1
+            node = node.children.get(part)
+            if node is None:
+                return False
+            if node.is_terminal:
+                return True
+        return False
+
+class PathMatcher:
+    """Path exclusion patterns precompiled by kind, so a path is tested without a per-pattern loop.
+    
+    Plain directory or file names go into a set checked against the path's
+    components, "*.ext" patterns into a suffix tuple for str.endswith,
+    patterns starting with a literal directory into an ExclusionTrie, and
+    any other glob into one compiled alternation. It matches the same paths
+    as SearchEngine._should_exclude.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """Split the patterns into names, directory needles, suffixes, a trie and globs.
+        
+        Args:
+            patterns: Path exclusion patterns
+        """
+        names = set()
+        dir_needles = set()
+        suffixes = set()
+        globs = []
+        trie = ExclusionTrie()
+
+        for pattern in patterns:
+            # Every pattern excludes paths containing its bare name as a component
+            name = pattern.rstrip('/*')
+            if name:
+                names.add(name)
+
+            # A plain name, "name/" or "name/*" matches nothing beyond that
+            if pattern in (name, f"{name}/", f"{name}/*") and '/' not in name and _GLOB_CHARS.isdisjoint(name):
+                continue
+
+            if pattern.endswith('/'):
+                dir_needles.add(f"/{pattern.rstrip('/')}/")
+            elif pattern.startswith("*.") and '/' not in pattern and _GLOB_CHARS.isdisjoint(pattern[1:]):
+                suffixes.add(pattern[1:])
+            elif '/' in pattern and _GLOB_CHARS.isdisjoint(pattern.split('/', 1)[0]) and not pattern.startswith('/'):
+                trie.add(pattern)
+            else:
+                globs.append(fnmatch.translate(pattern))
+
+        self.trie = trie
+        self.names = frozenset(names)
+        self.dir_needles = tuple(sorted(dir_needles))
+        self.suffixes = tuple(sorted(suffixes))
+        self.glob_regex: Optional[Pattern] = re.compile("|".join(sorted(globs))) if globs else None
+
+    @property
+    def by_name_only(self) -> bool:
+        """True when every pattern is a plain name or a "*.ext" suffix."""
+        return not self.dir_needles and not self.trie.children and self.glob_regex is None
+
+    def excludes_name(self, name: str) -> bool:
+        """Check a single file or directory name against the plain names and suffixes.
+        
+        Args:
+            name: File or directory name, without any parent directories
+            
+        Returns:
+            True if the name is excluded
+        """
+        return name in self.names or (bool(self.suffixes) and name.endswith(self.suffixes))
+
+    def matches(self, path: str) -> bool:
+        """Check whether a path, relative to the base directory, is excluded.
+        
+        Args:
+            path: Relative path to check
+            
+        Returns:
+            True if any exclusion pattern matches the path or one of its parents
+        """
+        pure_path = PurePath(path)
+        if not self.names.isdisjoint(pure_path.parts):
+            return True
+
+        if self.dir_needles:
+            wrapped = f"/{path}/"
+            if any(needle in wrapped for needle in self.dir_needles):
+                return True
+
+        if self.trie.children and self.trie.is_excluded(pure_path.parts):
+            return True
+
+        if self.suffixes or self.glob_regex is not None:
+            # Globs are tested against the path and each of its parent directories
+            for candidate in (path, *map(str, pure_path.parents)):
+                if self.suffixes and candidate.endswith(self.suffixes):
+                    return True
+                if self.glob_regex is not None and self.glob_regex.match(candidate):
+                    return True
+
+        return False
+
+# Every ExclusionsManager in a run sees the same built-in exclusions, so the
+# compiled forms are built once per distinct set of patterns
+@functools.lru_cache(maxsize=16)
+def _shared_path_matcher(patterns: FrozenSet[str]) -> PathMatcher:
+    """Build, or reuse, the PathMatcher for a set of path exclusion patterns."""
+    return PathMatcher(patterns)
+
+def _plain_names(matcher: PathMatcher) -> FrozenSet[str]:
+    """Return the matcher's names that hold no "/" or glob characters."""
+    return frozenset(
+        name for name in matcher.names
+        if '/' not in name and _GLOB_CHARS.isdisjoint(name)
+    )
+
+def configured_dirnames(config_manager: ConfigManager) -> FrozenSet[str]:
+    """Return the plain names excluded by the path exclusions stored in the config.
+    
+    Unlike ExclusionsManager.excluded_dirnames, this only reads the stored
+    system and user path exclusions, so it skips the framework detection
+    and config sync an ExclusionsManager runs when it is built.
+    """
+    exclusions = config_manager.get_exclusions()
+    patterns = frozenset(
+        normalize_path_pattern(pattern)
+        for key in ("system_generated", "user_path")
+        for pattern in exclusions.get(key, ())
+    )
+    return _plain_names(_shared_path_matcher(patterns - {""}))
 
 class ExclusionsManager:
     """Handles exclusion logic including language-based and user-defined exclusions."""
-    theme = ThemeManager.get_theme()
 
     # Standard exclusions by language
-    EXCLUSIONS_BY_LANGUAGE: Dict[str, List[str]] = {
-        "Python": ["*.pyc", "__pycache__", "venv", ".pytest_cache", "*.pyo", "*.pyd", "*.whl",
-                   ".tox", ".mypy_cache", "pip-wheel-metadata", ".coverage", "nosetests.xml",
-                   "*.egg-info", "*.eggs", "htmlcov", ".pytype", "*.log"],
-        "JavaScript": ["node_modules", "node_modules/", "dist", "build", ".npm", ".yarn", "coverage",
-                       "jspm_packages", ".eslintcache", ".cache", "*.log", "bower_components"],
-        "Java": ["target", "bin", ".gradle", ".idea", "*.iml", "*.ipr", "*.iws", ".classpath",
-                 ".project", ".settings", "*.class", "out", ".mvn", "*.log"],
-        "Go": ["bin", "pkg", "*.exe", "*.test", "*.out", "*.mod", "*.sum", ".vscode",
-               ".idea", "*.log", ".DS_Store", "vendor", "vendor/"],
-        "Rust": ["target", "Cargo.lock", "debug", "release", "incremental", "*.log"],
-        "C++": ["*.o", "*.obj", "*.exe", "*.dll", "*.dylib", "*.so", "build", "cmake-build-debug",
-                "cmake-build-release", "Makefile", "*.log", "Debug", "Release"],
-        "C#": ["bin", "obj", "*.suo", "*.user", "*.csproj.user", "*.dll", "*.exe",
-               "*.pdb", "*.appx", "AppPackages", "node_modules", "*.log"],
-        "Ruby": ["*.gem", ".bundle", ".yardoc", "coverage", "tmp", "vendor/bundle",
-                 "log", "node_modules", "*.log"],
-        "PHP": ["vendor", "vendor/", "*.log", "composer.lock", "composer.phar", ".phpunit.result.cache",
-                "node_modules", "coverage", "cache", "*.tar.gz"],
+    EXCLUSIONS_BY_LANGUAGE: Dict[str, FrozenSet[str]] = {
+        "Python": frozenset({"*.pyc", "__pycache__", "venv", ".pytest_cache", "*.pyo", "*.pyd", "*.whl",
+                             ".tox", ".mypy_cache", "pip-wheel-metadata", ".coverage", "nosetests.xml",
+                             "*.egg-info", "*.eggs", "htmlcov", ".pytype", "*.log"}),
+        "JavaScript": frozenset({"node_modules", "dist", "build", ".npm", ".yarn", "coverage",
+                                 "jspm_packages", ".eslintcache", ".cache", "*.log", "bower_components"}),
+        "Java": frozenset({"target", "bin", ".gradle", ".idea", "*.iml", "*.ipr", "*.iws", ".classpath",
+                           ".project", ".settings", "*.class", "out", ".mvn", "*.log"}),
+        "Go": frozenset({"bin", "pkg", "*.exe", "*.test", "*.out", "*.mod", "*.sum", ".vscode",
+                         ".idea", "*.log", ".DS_Store", "vendor"}),
+        "Rust": frozenset({"target", "Cargo.lock", "debug", "release", "incremental", "*.log"}),
+        "C++": frozenset({"*.o", "*.obj", "*.exe", "*.dll", "*.dylib", "*.so", "build", "cmake-build-debug",
+                          "cmake-build-release", "Makefile", "*.log", "Debug", "Release"}),
+        "C#": frozenset({"bin", "obj", "*.suo", "*.user", "*.csproj.user", "*.dll", "*.exe",
+                         "*.pdb", "*.appx", "AppPackages", "node_modules", "*.log"}),
+        "Ruby": frozenset({"*.gem", ".bundle", ".yardoc", "coverage", "tmp", "vendor/bundle",
+                           "log", "node_modules", "*.log"}),
+        "PHP": frozenset({"vendor", "*.log", "composer.lock", "composer.phar", ".phpunit.result.cache",
+                          "node_modules", "coverage", "cache", "*.tar.gz"}),
     }
 
     # Standard exclusions by framework
-    EXCLUSIONS_BY_FRAMEWORK: Dict[str, List[str]] = {
-        "Laravel": ["storage", "bootstrap/cache", "node_modules", "node_modules/", 
-                   "vendor", "vendor/", ".env", "composer.lock", "public/storage", 
-                   "tests", "phpunit.xml", "coverage", "dist"],
-        "Node.js": ["node_modules", "node_modules/", "dist", "dist/", "coverage", "coverage/"],
-        "Django": ["db.sqlite3", "migrations", "migrations/", "__pycache__", "__pycache__/"],
-        "Spring Boot": ["target", "target/", ".gradle", ".gradle/", ".mvn", ".mvn/"],
-        "Ruby on Rails": ["log", "log/", "tmp", "tmp/", ".bundle", ".bundle/"],
+    EXCLUSIONS_BY_FRAMEWORK: Dict[str, FrozenSet[str]] = {
+        "Laravel": frozenset({"storage", "bootstrap/cache", "node_modules", "vendor", ".env",
+                             "composer.lock", "public/storage", "tests", "phpunit.xml", "coverage", "dist"}),
+        "Node.js": frozenset({"node_modules", "dist", "coverage"}),
+        "Django": frozenset({"db.sqlite3", "migrations", "__pycache__"}),
+        "Spring Boot": frozenset({"target", ".gradle", ".mvn"}),
+        "Ruby on Rails": frozenset({"log", "tmp", ".bundle"}),
     }
 
     def __init__(
@@ -51,15 +281,28 @@ class ExclusionsManager:
         config_manager: ConfigManager
     ):
         """Initialize the ExclusionsManager with stored exclusions."""
+        self.theme = ThemeManager.get_theme()
         self.config = config_manager
-        self.base_dir = Path(base_dir).resolve()
-        self.detected_frameworks = self.detect_codebase_type()
+        # Resolved once; comparisons and probes work on the string
+        self._base_dir_str = os.path.realpath(base_dir)
+        self.base_dir = Path(self._base_dir_str)
+        self._detect_frameworks()
 
         # Ensure system/user exclusions are initialized properly with separate types
         self.system_path_exclusions = set()
         self.user_path_exclusions = set()
         self.user_string_exclusions = set()
         
+        # Built on first use from the exclusion sets; every mutator clears them
+        # through _invalidate_caches()
+        self._combined: Optional[Dict[str, FrozenSet[str]]] = None
+        self._search_regex: Optional[Dict[str, str]] = None
+        self._compiled_regex: Optional[Tuple[Optional[Pattern], Optional[Pattern]]] = None
+        self._matcher: Optional[PathMatcher] = None
+        # (config state token, system exclusions) at the last update_exclusions
+        # that left the config in sync with them
+        self._last_sync: Optional[Tuple[int, FrozenSet[str]]] = None
+        
         # Load exclusions from config
         self._load_exclusions_from_config()
 
@@ -68,91 +311,154 @@ class ExclusionsManager:
             self.update_exclusions()
 
     def detect_codebase_type(self) -> Set[str]:
-        """Detect all applicable frameworks in the codebase instead of returning just one."""
+        """Detect all applicable frameworks in the codebase instead of returning just one.
+        
+        The base directory is listed once and the signatures are checked in
+        memory; the result is reused until the directory's mtime changes,
+        within a run and across runs through the frameworks stored in the
+        config. The (base directory, mtime) it was detected at is kept in
+        detected_at.
+        """
+        base_dir = self._base_dir_str
+        try:
+            key = (base_dir, os.stat(base_dir).st_mtime_ns)
+        except OSError:
+            key = None
+        self.detected_at = key
+        if key is not None and key in _detected_frameworks_cache:
+            return set(_detected_frameworks_cache[key])
+
+        # Stored by the last run for the same, unchanged base directory; the
+        # directory is stored with the mtime, since a different directory can
+        # share the same mtime
+        stored_frameworks = self.config.get_frameworks()
+        detected_at = self.config.get_frameworks_detected_at()
+        if (key is not None and stored_frameworks
+                and detected_at is not None and detected_at == key):
+            _detected_frameworks_cache[key] = frozenset(stored_frameworks)
+            return set(stored_frameworks)
+
+        try:
+            with os.scandir(base_dir) as it:
+                entries = {entry.name for entry in it}
+        except OSError:
+            entries = set()
+
         detected_frameworks = set()
-        base_dir = Path(self.base_dir)
 
-        if (base_dir / "artisan").exists() and (base_dir / "composer.json").exists():
+        if "artisan" in entries and "composer.json" in entries:
             detected_frameworks.add("Laravel")
-        if (base_dir / "composer.json").exists():
-            detected_frameworks.add("PHP")
-        if (base_dir / "package.json").exists():
-            detected_frameworks.add("JavaScript")
-
-        language_signatures = {
-            "Python": ["requirements.txt", "setup.py", "Pipfile", "__init__.py"],
-            "Java": ["pom.xml", "build.gradle"],
-            "Go": ["go.mod", "main.go"],
-            "Rust": ["Cargo.toml"],
-            "C++": ["CMakeLists.txt", ".cpp", ".h"],
-            "C#": [".csproj", "Program.cs"],
-            "Ruby": ["Gemfile"],
-        }
 
-        for language, signatures in language_signatures.items():
-            if any((self.base_dir / signature).exists() for signature in signatures):
-                detected_frameworks.add(language)
+        # One lookup per entry, by name and by extension
+        for name in entries:
+            detected_frameworks.update(_SIG_TO_LANG.get(name, ()))
+            detected_frameworks.update(_EXT_TO_LANG.get(os.path.splitext(name)[1], ()))
+
+        if not detected_frameworks:
+            detected_frameworks = {"Unknown"}
+        if key is not None:
+            _detected_frameworks_cache[key] = frozenset(detected_frameworks)
+        return detected_frameworks
+
 
-        return detected_frameworks if detected_frameworks else {"Unknown"}
+    def _detect_frameworks(self) -> None:
+        """Detect the frameworks and sort their exclusions for display.
+        
+        Language/framework exclusions only depend on the detected frameworks,
+        so they are sorted here instead of on every listing.
+        """
+        self.detected_frameworks = self.detect_codebase_type()
+        self._sorted_language = tuple(sorted(self.get_language_exclusions()))
+        self._sorted_framework = tuple(sorted(self.get_framework_exclusions()))
 
+    def _is_base_dir(self, path: str) -> bool:
+        """Check whether a path names this manager's base directory, resolving it only when needed."""
+        return path == self._base_dir_str or os.path.realpath(path) == self._base_dir_str
 
     def _load_exclusions_from_config(self):
         """Load exclusions from config file with type separation."""
         config_exclusions = self.config.get_exclusions()
         
         # System exclusions are always path-based
-        self.system_path_exclusions = set(config_exclusions.get("system_generated", []))
+        self.system_path_exclusions = set(map(normalize_path_pattern, config_exclusions.get("system_generated", [])))
         
-        # User exclusions are separated by type
-        self.user_path_exclusions = set(config_exclusions.get("user_path", []))
+        # User exclusions are separated by type; string exclusions are literal text
+        self.user_path_exclusions = set(map(normalize_path_pattern, config_exclusions.get("user_path", [])))
         self.user_string_exclusions = set(config_exclusions.get("user_string", []))
         
         # For backward compatibility - migrate existing user_added to path_exclusions
         if "user_added" in config_exclusions:
-            self.user_path_exclusions.update(config_exclusions.get("user_added", []))
+            self.user_path_exclusions.update(map(normalize_path_pattern, config_exclusions.get("user_added", [])))
+        self.user_path_exclusions.discard("")
+        
+        self._invalidate_caches()
+
+    def _invalidate_caches(self):
+        """Drop the combined exclusions, search regexes and matcher built from the exclusion sets."""
+        self._combined = None
+        self._search_regex = None
+        self._compiled_regex = None
+        self._matcher = None
     
     def update_exclusions(self):
         """Updates exclusions based on all detected frameworks in the codebase."""
-        theme = ThemeManager.get_theme()
-        current_base_dir = Path(self.config.get_base_dir())
+        current_base_dir = self.config.get_base_dir()
 
-        # If root directory changed, reset cached framework detection
-        if not hasattr(self, "_cached_frameworks") or self.base_dir != current_base_dir:
-            self.base_dir = current_base_dir
-            self._cached_frameworks = self.detect_codebase_type()
+        # If root directory changed, redo the framework detection from __init__
+        if not self._is_base_dir(current_base_dir):
+            self._base_dir_str = os.path.realpath(current_base_dir)
+            self.base_dir = Path(self._base_dir_str)
+            self._detect_frameworks()
+            self._invalidate_caches()
 
-        detected_frameworks = self._cached_frameworks
+        detected_frameworks = self.detected_frameworks
 
         # Get exclusions for all detected frameworks
-        all_exclusions = set()
-        for framework in detected_frameworks:
-            all_exclusions.update(self.EXCLUSIONS_BY_LANGUAGE.get(framework, []))
-            all_exclusions.update(self.EXCLUSIONS_BY_FRAMEWORK.get(framework, []))
+        all_exclusions = frozenset().union(
+            *(self.EXCLUSIONS_BY_LANGUAGE.get(framework, frozenset()) for framework in detected_frameworks),
+            *(self.EXCLUSIONS_BY_FRAMEWORK.get(framework, frozenset()) for framework in detected_frameworks),
+        )
+
+        # Nothing to do when the same exclusions were already synced and the
+        # config has not changed since
+        state_token = self.config.state_token()
+        if state_token is not None and self._last_sync == (state_token, all_exclusions):
+            return
 
         self.system_path_exclusions = all_exclusions
+        self._invalidate_caches()
 
         # Save exclusions only if they changed
         current_exclusions = set(self.config.get_exclusions().get("system_generated", []))
-        if current_exclusions != set(all_exclusions):
+        if current_exclusions != all_exclusions:
             self.config.set_exclusions({
                 "system_generated": sorted(self.system_path_exclusions),
                 "user_path": sorted(self.user_path_exclusions),
                 "user_string": sorted(self.user_string_exclusions)
             })
 
-    def get_language_exclusions(self) -> Set[str]:
+        state_token = self.config.state_token()
+        self._last_sync = (state_token, all_exclusions) if state_token is not None else None
+
+    def get_language_exclusions(self) -> FrozenSet[str]:
         """Retrieve language-specific exclusions based on detected languages."""
-        return {
-            exclusion for framework in self.detected_frameworks
-            for exclusion in self.EXCLUSIONS_BY_LANGUAGE.get(framework, [])
-        }
+        return frozenset().union(
+            *(self.EXCLUSIONS_BY_LANGUAGE.get(framework, frozenset()) for framework in self.detected_frameworks)
+        )
 
-    def get_framework_exclusions(self) -> Set[str]:
+    def get_framework_exclusions(self) -> FrozenSet[str]:
         """Retrieve framework-specific exclusions based on detected frameworks."""
-        return {
-            exclusion for framework in self.detected_frameworks
-            for exclusion in self.EXCLUSIONS_BY_FRAMEWORK.get(framework, [])
-        }
+        return frozenset().union(
+            *(self.EXCLUSIONS_BY_FRAMEWORK.get(framework, frozenset()) for framework in self.detected_frameworks)
+        )
+
+    def sorted_language_exclusions(self) -> Tuple[str, ...]:
+        """Return the language-specific exclusions, sorted."""
+        return self._sorted_language
+
+    def sorted_framework_exclusions(self) -> Tuple[str, ...]:
+        """Return the framework-specific exclusions, sorted."""
+        return self._sorted_framework
 
     def get_user_exclusions(self) -> Dict[str, Set[str]]:
         """Retrieve user-defined exclusions by type."""
@@ -161,74 +467,155 @@ class ExclusionsManager:
             "string": self.user_string_exclusions
         }
 
-    def get_combined_exclusions(self) -> Dict[str, Set[str]]:
-        """Returns exclusions grouped by type."""
-        return {
-            "language": self.get_language_exclusions(),
-            "framework": self.get_framework_exclusions(),
-            "user_path": self.user_path_exclusions,
-            "user_string": self.user_string_exclusions
-        }
+    def get_combined_exclusions(self) -> Dict[str, FrozenSet[str]]:
+        """Returns exclusions grouped by type.
+        
+        The groups are built once and reused until an exclusion changes.
+        """
+        if self._combined is None:
+            self._combined = {
+                "language": self.get_language_exclusions(),
+                "framework": self.get_framework_exclusions(),
+                "user_path": frozenset(self.user_path_exclusions),
+                "user_string": frozenset(self.user_string_exclusions)
+            }
+        return self._combined
 
-    def add_exclusion(self, pattern: str, exclusion_type: str = "path"):
-        """Adds a user-defined exclusion pattern with type specification."""
+    def add_exclusion(self, pattern: str, exclusion_type: str = "path", verbose: bool = True) -> bool:
+        """Adds a user-defined exclusion pattern with type specification.
+        
+        Args:
+            pattern: Pattern to exclude
+            exclusion_type: "path" or "string"
+            verbose: Print a message for the pattern; bulk callers pass False
+                and report once for the whole batch
+            
+        Returns:
+            True if the pattern was added
+        """
         if exclusion_type not in ["path", "string"]:
-            console.print(f"[{self.theme['error']}]Invalid exclusion type: {exclusion_type}[/{self.theme['error']}]")
-            return
+            get_console().print(f"[{self.theme['error']}]Invalid exclusion type: {exclusion_type}[/{self.theme['error']}]")
+            return False
+            
+        if exclusion_type == "path":
+            pattern = normalize_path_pattern(pattern)
+            if not pattern:
+                get_console().print(f"[{self.theme['error']}]Invalid path exclusion pattern.[/{self.theme['error']}]")
+                return False
             
         # Check if pattern already exists in appropriate collection
         if exclusion_type == "path" and pattern in self.user_path_exclusions:
-            console.print(f"[{self.theme['warning']}]Pattern '{pattern}' is already excluded as a path.[/{self.theme['warning']}]")
-            return
+            if verbose:
+                get_console().print(f"[{self.theme['warning']}]Pattern '{pattern}' is already excluded as a path.[/{self.theme['warning']}]")
+            return False
         elif exclusion_type == "string" and pattern in self.user_string_exclusions:
-            console.print(f"[{self.theme['warning']}]Pattern '{pattern}' is already excluded as a string.[/{self.theme['warning']}]")
-            return
+            if verbose:
+                get_console().print(f"[{self.theme['warning']}]Pattern '{pattern}' is already excluded as a string.[/{self.theme['warning']}]")
+            return False
 
         # Add to the appropriate collection
         if exclusion_type == "path":
             self.user_path_exclusions.add(pattern)
         else:
             self.user_string_exclusions.add(pattern)
+        self._invalidate_caches()
             
         # Save to config
         self.config.add_exclusion(pattern, exclusion_type)
-        console.print(f"Successfully added {exclusion_type} exclusion: [{self.theme['highlight']}]{pattern}[/{self.theme['highlight']}]")
+        if verbose:
+            get_console().print(f"Successfully added {exclusion_type} exclusion: [{self.theme['highlight']}]{pattern}[/{self.theme['highlight']}]")
+        return True
 
-    def remove_exclusion(self, pattern: str, exclusion_type: str = "path"):
-        """Removes a user-defined exclusion pattern with type specification."""
+    def remove_exclusion(self, pattern: str, exclusion_type: str = "path", verbose: bool = True) -> bool:
+        """Removes a user-defined exclusion pattern with type specification.
+        
+        Args:
+            pattern: Pattern to stop excluding
+            exclusion_type: "path" or "string"
+            verbose: Print a message for the pattern; bulk callers pass False
+                and report once for the whole batch
+            
+        Returns:
+            True if the pattern was removed
+        """
         if exclusion_type not in ["path", "string"]:
-            console.print(f"[{self.theme['error']}]Invalid exclusion type: {exclusion_type}[/{self.theme['error']}]")
-            return
+            get_console().print(f"[{self.theme['error']}]Invalid exclusion type: {exclusion_type}[/{self.theme['error']}]")
+            return False
+            
+        if exclusion_type == "path":
+            pattern = normalize_path_pattern(pattern)
             
         # Check if pattern exists in appropriate collection
         if exclusion_type == "path" and pattern not in self.user_path_exclusions:
-            console.print(f"[{self.theme['warning']}]Pattern '{pattern}' is not in path exclusions.[/{self.theme['warning']}]")
-            return
+            if verbose:
+                get_console().print(f"[{self.theme['warning']}]Pattern '{pattern}' is not in path exclusions.[/{self.theme['warning']}]")
+            return False
         elif exclusion_type == "string" and pattern not in self.user_string_exclusions:
-            console.print(f"[{self.theme['warning']}]Pattern '{pattern}' is not in string exclusions.[/{self.theme['warning']}]")
-            return
+            if verbose:
+                get_console().print(f"[{self.theme['warning']}]Pattern '{pattern}' is not in string exclusions.[/{self.theme['warning']}]")
+            return False
 
         # Remove from appropriate collection
         if exclusion_type == "path":
             self.user_path_exclusions.remove(pattern)
         else:
             self.user_string_exclusions.remove(pattern)
+        self._invalidate_caches()
             
-        # Save to config
-        self.config.remove_exclusion(pattern, exclusion_type)
-        console.print(f"Successfully removed {exclusion_type} exclusion: [{self.theme['highlight']}]{pattern}[/{self.theme['highlight']}]")
+        # Save to config, dropping every stored spelling of a path pattern
+        if exclusion_type == "path":
+            stored = [
+                stored_pattern for stored_pattern in self.config.get_exclusions().get("user_path", [])
+                if normalize_path_pattern(stored_pattern) == pattern
+            ]
+            with self.config.batch():
+                for stored_pattern in stored or [pattern]:
+                    self.config.remove_exclusion(stored_pattern, exclusion_type)
+        else:
+            self.config.remove_exclusion(pattern, exclusion_type)
+        if verbose:
+            get_console().print(f"Successfully removed {exclusion_type} exclusion: [{self.theme['highlight']}]{pattern}[/{self.theme['highlight']}]")
+        return True
+
+    def path_matcher(self) -> PathMatcher:
+        """Return the PathMatcher for the language, framework and user path exclusions.
+        
+        It is built once per set of patterns, shared between instances, and
+        reused until an exclusion changes.
+        """
+        if self._matcher is None:
+            exclusions = self.get_combined_exclusions()
+            self._matcher = _shared_path_matcher(
+                exclusions["language"] | exclusions["framework"] | exclusions["user_path"]
+            )
+        return self._matcher
+
+    def excluded_dirnames(self) -> FrozenSet[str]:
+        """Return the plain directory and file names excluded wherever they appear.
+        
+        Walkers should use os.walk(..., topdown=True) and drop these from
+        dirnames in place (dirnames[:] = ...) so excluded subtrees are never
+        entered.
+        """
+        return _plain_names(self.path_matcher())
+
+    def matches(self, path: str) -> bool:
+        """Check whether a path, relative to the base directory, is excluded by a path exclusion."""
+        return self.path_matcher().matches(path)
 
     def generate_path_exclusion_regex(self) -> str:
-        """Generates a regex pattern for filtering paths based on exclusions."""
+        """Generates a regex pattern for filtering paths based on exclusions.
+        
+        Kept for callers that need the pattern as a string; matches() tests
+        a path without compiling or scanning this unanchored alternation.
+        """
         combined_exclusions = self.system_path_exclusions | self.user_path_exclusions
         
-        # Ensure exclusions apply correctly to full paths
-        escaped_patterns = [
-            re.escape(pattern).replace("\\*", ".*").replace("\\/", "/")  # Fix slashes for cross-platform compatibility
-            for pattern in combined_exclusions
-        ]
+        # Translate each glob in one pass; the end anchor is dropped so a
+        # pattern matches anywhere in the full path
+        translated_patterns = [_unanchored_glob(pattern) for pattern in sorted(combined_exclusions)]
         
-        return "|".join(escaped_patterns) if escaped_patterns else "(?!)"
+        return "|".join(translated_patterns) if translated_patterns else "(?!)"
         
     def generate_string_exclusion_regex(self) -> str:
         """Generates a regex pattern for filtering content based on exclusions."""
@@ -236,48 +623,58 @@ class ExclusionsManager:
             return ""
             
         # String exclusions are simple pattern matches
-        escaped_patterns = [re.escape(pattern) for pattern in self.user_string_exclusions]
+        escaped_patterns = [re.escape(pattern) for pattern in sorted(self.user_string_exclusions)]
         return "|".join(escaped_patterns)
         
     def generate_search_exclusion_regex(self) -> Dict[str, str]:
-        """Generates regex patterns for both path and string filtering."""
-        return {
-            "path": self.generate_path_exclusion_regex(),
-            "string": self.generate_string_exclusion_regex()
-        }
+        """Generates regex patterns for both path and string filtering.
+        
+        The patterns are built once and reused until an exclusion changes.
+        """
+        if self._search_regex is None:
+            self._search_regex = {
+                "path": self.generate_path_exclusion_regex(),
+                "string": self.generate_string_exclusion_regex()
+            }
+        return self._search_regex
+
+    def compiled_search_exclusion_regex(self) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+        """Return the path and string exclusion regexes compiled, or None where nothing is excluded.
+        
+        They are compiled once and reused until an exclusion changes.
+        """
+        if self._compiled_regex is None:
+            regex = self.generate_search_exclusion_regex()
+            self._compiled_regex = (
+                re.compile(regex["path"]) if regex["path"] != "(?!)" else None,
+                re.compile(regex["string"]) if regex["string"] else None,
+            )
+        return self._compiled_regex
 
     def get_exclusion_summary(self) -> str:
-        """Returns a formatted string of exclusions for display."""
+        """Returns a formatted string of exclusions for display.
+        
+        The sections are written into one buffer; language and framework
+        exclusions come presorted, so only the user exclusions are sorted here.
+        """
         exclusions = self.get_combined_exclusions()
+        highlight = self.theme['highlight']
         
-        formatted_sections = []
+        sections = (
+            ("Language exclusions (path):", self._sorted_language if exclusions.get("language") else ()),
+            ("Framework exclusions (path):", self._sorted_framework if exclusions.get("framework") else ()),
+            ("User-defined path exclusions:", sorted(exclusions.get("user_path", ()))),
+            ("User-defined string exclusions:", sorted(exclusions.get("user_string", ()))),
+        )
         
-        # Display language exclusions
-        if exclusions.get("language"):
-            formatted_sections.append(
-                f"[{self.theme['highlight']}]Language exclusions (path):[/{self.theme['highlight']}]\n"
-                + "\n".join(sorted(exclusions["language"]))
-            )
-            
-        # Display framework exclusions
-        if exclusions.get("framework"):
-            formatted_sections.append(
-                f"[{self.theme['highlight']}]Framework exclusions (path):[/{self.theme['highlight']}]\n"
-                + "\n".join(sorted(exclusions["framework"]))
-            )
-            
-        # Display user path exclusions
-        if exclusions.get("user_path"):
-            formatted_sections.append(
-                f"[{self.theme['highlight']}]User-defined path exclusions:[/{self.theme['highlight']}]\n"
-                + "\n".join(sorted(exclusions["user_path"]))
-            )
-            
-        # Display user string exclusions
-        if exclusions.get("user_string"):
-            formatted_sections.append(
-                f"[{self.theme['highlight']}]User-defined string exclusions:[/{self.theme['highlight']}]\n"
-                + "\n".join(sorted(exclusions["user_string"]))
-            )
+        buffer = io.StringIO()
+        for header, patterns in sections:
+            if not patterns:
+                continue
+            if buffer.tell():
+                buffer.write("\n\n")
+            buffer.write(f"[{highlight}]{header}[/{highlight}]\n")
+            buffer.write(patterns[0])
+            buffer.writelines(f"\n{pattern}" for pattern in patterns[1:])
 
-        return "\n\n".join(formatted_sections) if formatted_sections else f"[{self.theme['warning']}]No exclusions configured.[/{self.theme['warning']}]"
\ No newline at end of file
+        return buffer.getvalue() or f"[{self.theme['warning']}]No exclusions configured.[/{self.theme['warning']}]"
\ No newline at end of file
@@ -33,31 +33,61 @@ def fix_indexing_timeout():
         
         # 1. Find and modify the file processing code to add timeouts
         if "with open(file_path, 'r'" in content:
-            # Add timeout to file reading
-            new_content = content.replace(
-                "with open(file_path, 'r'",
-                "# Add timeout to prevent hanging on problematic files\n"
-                "                            try:\n"
-                "                                with open(file_path, 'r'"
+            # Read through the timeout helper instead of an unbounded f.read()
+            new_content = re.sub(
+                r"with open\(file_path, 'r'[^\n]*\) as f:\n\s*content = f\.read\(\)",
+                "content = read_with_timeout(file_path).decode('utf-8', errors='replace')",
+                content
             )
             
-            # Add exception handling for file processing
+            # Add exception handling for file processing; a read aborted by
+            # closing the file surfaces as an OSError
             new_content = new_content.replace(
                 "                        except (UnicodeDecodeError, PermissionError) as e:",
-                "                        except (UnicodeDecodeError, PermissionError, TimeoutError) as e:"
+                "                        except (UnicodeDecodeError, PermissionError, TimeoutError, OSError) as e:"
             )
             
-            # Add timeout logic to search file
+            # Add timeout logic to index file. select() reports regular files
+            # as always ready, so it cannot time out a read; instead one stat
+            # refuses oversized files and anything that is not a regular file
+            # (FIFOs and devices can block forever). On the main thread SIGALRM
+            # also aborts a slow read; on Windows, which has no SIGALRM, a timer
+            # closes the file. Indexing worker threads rely on the stat alone
             new_content = new_content.replace(
                 "# Function to index a single file",
                 "# Add file timeout mechanism\n"
-                "                def read_with_timeout(file_obj, timeout=1.0):\n"
-                "                    \"\"\"Read from a file with timeout to prevent hanging.\"\"\"\n"
-                "                    import select\n"
-                "                    # Check if the file is ready for reading\n"
-                "                    if not select.select([file_obj], [], [], timeout)[0]:\n"
-                "                        raise TimeoutError(f\"Reading file timed out after {timeout}s\")\n"
-                "                    return file_obj.read()\n\n"
+                "                def read_with_timeout(path, max_bytes=1 << 20, timeout=1.0):\n"
+                "                    \"\"\"Read a file's bytes, giving up on large, special or slow files.\"\"\"\n"
+                "                    import signal\n"
+                "                    import stat\n"
+                "                    st = os.stat(path)\n"
+                "                    if not stat.S_ISREG(st.st_mode):\n"
+                "                        raise TimeoutError(\"Not a regular file\")\n"
+                "                    if st.st_size > max_bytes:\n"
+                "                        raise TimeoutError(f\"File larger than {max_bytes} bytes\")\n"
+                "                    with open(path, 'rb', buffering=max_bytes) as file_obj:\n"
+                "                        if os.name == 'nt':\n"
+                "                            timer = threading.Timer(timeout, file_obj.close)\n"
+                "                            timer.start()\n"
+                "                            try:\n"
+                "                                return file_obj.read(max_bytes)\n"
+                "                            except ValueError:\n"
+                "                                raise TimeoutError(f\"Reading file timed out after {timeout}s\")\n"
+                "                            finally:\n"
+                "                                timer.cancel()\n"
+                "                        if hasattr(signal, 'setitimer') and threading.current_thread() is threading.main_thread():\n"
+                "                            def on_alarm(signum, frame):\n"
+                "                                raise TimeoutError(f\"Reading file timed out after {timeout}s\")\n"
+                "                            previous_handler = signal.signal(signal.SIGALRM, on_alarm)\n"
+                "                            signal.setitimer(signal.ITIMER_REAL, timeout)\n"
+                "                            try:\n"
+                "                                return file_obj.read(max_bytes)\n"
+                "                            finally:\n"
+                "                                signal.setitimer(signal.ITIMER_REAL, 0)\n"
+                "                                signal.signal(signal.SIGALRM, previous_handler)\n"
+                "                        # Signals only reach the main thread; the stat checks\n"
+                "                        # above already refused files that could block\n"
+                "                        return file_obj.read(max_bytes)\n\n"
                 "                # Function to index a single file"
             )
             
@@ -230,17 +260,9 @@ def disable_output_interleaving():
         # Create a search engine
         search_engine = SearchEngine(base_dir, config)
         
-        # Perform the search directly
+        # Perform the search directly, without the index or the engine's line loop
         print(f"\\nSearching for '{query}' in {base_dir}...")
-        results = search_engine.search(
-            query, 
-            use_regex=False, 
-            case_sensitive=True,
-            wait_for_index=False,  # Never wait for indexing
-            use_index=False,       # Never use index
-            max_results=100,
-            timeout=5              # Short timeout
-        )
+        results = _direct_search(search_engine, query, max_results=100)
         
         # Display results
         file_count = len(set(r.file_path for r in results)) if results else 0
@@ -277,6 +299,62 @@ def disable_output_interleaving():
     # Separate from next prompt
     print("")
 
+def _direct_search(search_engine, query: str, max_results: int = 100):
+    \"\"\"Find query, as literal text, in the engine's files with one bytes.find pass per file.
+    
+    Files of 4 KiB or more are memory-mapped rather than read into a bytes
+    object, so the kernel pages them in as find() touches them. Only lines
+    holding a match are decoded; line numbers are counted between
+    consecutive matches rather than from the start of the file.
+    \"\"\"
+    import mmap
+    from cli.managers.search_engine import SearchResult
+    
+    needle = query.encode('utf-8')
+    string_excl_re = search_engine.exclusions_manager.compiled_search_exclusion_regex()[1]
+    results = []
+    
+    for file_path in search_engine._walk_files():
+        try:
+            with open(file_path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < 4096:
+                    # Mapping costs more than reading a small file
+                    data = f.read()
+                else:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            continue
+        
+        try:
+            pos = data.find(needle)
+            if pos == -1 or b'\\0' in data[:8192]:
+                # No match, or a binary file
+                continue
+            
+            line_number, counted_to = 1, 0
+            while pos != -1:
+                line_start = data.rfind(b'\\n', 0, pos) + 1
+                line_end = data.find(b'\\n', pos)
+                if line_end == -1:
+                    line_end = len(data)
+                line_number += data[counted_to:line_start].count(b'\\n')
+                counted_to = line_start
+                
+                line = data[line_start:line_end].decode('utf-8', errors='replace').rstrip('\\r')
+                if not (string_excl_re and string_excl_re.search(line)):
+                    results.append(SearchResult(file_path, line_number, line))
+                    if len(results) >= max_results:
+                        return results
+                
+                # One result per line, like the engine
+                pos = data.find(needle, line_end)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    
+    return results
+
 """
                     
                     # Replace the original function with the new one
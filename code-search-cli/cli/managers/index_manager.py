@@ -17,13 +17,13 @@ import threading
 from concurrent.futures import ThreadPoolExecutor
 
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from rich.console import Console
+from cli.console import get_console
 from rich.status import Status
 
 from cli.managers.config_manager import ConfigManager
 from cli.managers.exclusions_manager import ExclusionsManager
 
-console = Console()
+console = get_console()
 
 # Global variables for tracking background indexing
 background_indexer = None
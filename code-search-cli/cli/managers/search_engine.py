@@ -1,28 +1,47 @@
 """Search engine for code search CLI using native Python implementation."""
 
+import json
 import os
 import re
+import shutil
+import subprocess
+import threading
+import time
 from pathlib import Path
-from typing import List, Dict, Pattern, Optional, Union, Set, Iterator
+from typing import List, Dict, Pattern, Optional, Union, Set, Iterator, Tuple
 import fnmatch
-from rich.console import Console
+from cli.console import get_console
 
-from cli.managers.exclusions_manager import ExclusionsManager
+from cli.managers.exclusions_manager import ExclusionsManager, PathMatcher
 from cli.managers.config_manager import ConfigManager
 
-console = Console()
+
+# Resolved once; when ripgrep is not installed searches use the Python scanner
+RG_PATH = shutil.which("rg")
+
+# Phrases in ripgrep's error output when it rejects the query or a glob
+# before searching, as opposed to I/O errors on individual files
+_RG_REJECTED = (
+    "regex parse error",
+    "error parsing glob",
+    "is not allowed in a regex",
+    "exceeds size limit",
+)
 
 class SearchResult:
     """Represents a single search result."""
     
-    def __init__(self, file_path: Path, line_number: int, line_content: str, match_positions: List[tuple]):
+    def __init__(self, file_path: Path, line_number: int, line_content: str,
+                 match_positions: Optional[List[tuple]] = None):
         """Initialize a search result.
         
         Args:
             file_path: Path to the file containing the match
             line_number: Line number of the match (1-based)
             line_content: Content of the line containing the match
-            match_positions: List of (start, end) positions of matches in the line
+            match_positions: Optional list of (start, end) positions of matches in
+                the line. The searches leave this unset; the formatter finds the
+                matches again with the compiled query when it highlights them.
         """
         self.file_path = file_path
         self.line_number = line_number
@@ -72,6 +91,15 @@ class SearchEngine:
         Returns:
             True if the path should be excluded, False otherwise
         """
+        # Convert path to relative path for matching
+        rel_path = path.relative_to(self.base_dir)
+        path_str = str(rel_path)
+        
+        # Most paths are not excluded; the precompiled matcher answers that
+        # without walking the patterns, which is only needed for statistics
+        if not self.exclusions_manager.matches(path_str):
+            return False
+        
         # Get path exclusion patterns (only system_generated and user_path)
         exclusions = self.exclusions_manager.get_combined_exclusions()
         path_patterns = set()
@@ -87,53 +115,48 @@ class SearchEngine:
         # String exclusions should not affect path filtering
         # (user_string exclusions are only applied to file content)
         
-        # Convert path to relative path for matching
-        rel_path = path.relative_to(self.base_dir)
-        path_str = str(rel_path)
+        # First check for exact directory name in path parts (e.g., "vendor");
+        # a set of the path's components makes each pattern a constant-time lookup
+        path_parts = frozenset(rel_path.parts)
         
-        # First check for exact directory name in path parts (e.g., "vendor")
-        path_parts = path_str.split('/')
-        for pattern in path_patterns:
-            # Remove trailing /* if present for directory pattern checking
-            clean_pattern = pattern.rstrip('/*')
-            if clean_pattern in path_parts:
-                # Update statistics
-                self.search_stats["files_excluded"] += 1
-                if pattern not in self.search_stats["excluded_by_pattern"]:
-                    self.search_stats["excluded_by_pattern"][pattern] = 0
-                self.search_stats["excluded_by_pattern"][pattern] += 1
-                return True
-        
-        # Check if path matches any exclusion pattern
-        for pattern in path_patterns:
-            # Handle directory exclusions (patterns ending with /)
-            if pattern.endswith('/'):
-                if self._path_matches_dir_pattern(path_str, pattern):
-                    # Update statistics
-                    self.search_stats["files_excluded"] += 1
-                    if pattern not in self.search_stats["excluded_by_pattern"]:
-                        self.search_stats["excluded_by_pattern"][pattern] = 0
-                    self.search_stats["excluded_by_pattern"][pattern] += 1
-                    return True
-            # Handle regular file pattern
-            elif fnmatch.fnmatch(path_str, pattern):
-                # Update statistics
-                self.search_stats["files_excluded"] += 1
-                if pattern not in self.search_stats["excluded_by_pattern"]:
-                    self.search_stats["excluded_by_pattern"][pattern] = 0
-                self.search_stats["excluded_by_pattern"][pattern] += 1
-                return True
-            # Check if any parent directory matches the pattern
-            elif any(fnmatch.fnmatch(str(parent), pattern) 
-                    for parent in rel_path.parents):
-                # Update statistics
-                self.search_stats["files_excluded"] += 1
-                if pattern not in self.search_stats["excluded_by_pattern"]:
-                    self.search_stats["excluded_by_pattern"][pattern] = 0
-                self.search_stats["excluded_by_pattern"][pattern] += 1
-                return True
-                
-        return False
+        # Stop at the first matching pattern; trailing /* is removed for the
+        # directory name check
+        matched = next(
+            (p for p in path_patterns if p.rstrip('/*') in path_parts), None
+        )
+        if matched is None:
+            matched = next(
+                (p for p in path_patterns if self._path_matches_pattern(path_str, rel_path, p)),
+                None
+            )
+        if matched is None:
+            return False
+        
+        # Update statistics
+        self.search_stats["files_excluded"] += 1
+        excluded_by_pattern = self.search_stats["excluded_by_pattern"]
+        excluded_by_pattern[matched] = excluded_by_pattern.get(matched, 0) + 1
+        return True
+    
+    def _path_matches_pattern(self, path_str: str, rel_path: Path, pattern: str) -> bool:
+        """Check if a relative path matches a single path exclusion pattern.
+        
+        Args:
+            path_str: Relative path as a string
+            rel_path: Relative path, used to check its parent directories
+            pattern: Exclusion pattern
+            
+        Returns:
+            True if the path or one of its parent directories matches the pattern
+        """
+        # Handle directory exclusions (patterns ending with /)
+        if pattern.endswith('/'):
+            return self._path_matches_dir_pattern(path_str, pattern)
+        
+        # Handle regular file pattern, then check if any parent directory matches
+        return fnmatch.fnmatch(path_str, pattern) or any(
+            fnmatch.fnmatch(str(parent), pattern) for parent in rel_path.parents
+        )
     
     def _path_matches_dir_pattern(self, path: str, pattern: str) -> bool:
         """Check if a path matches a directory pattern.
@@ -168,52 +191,52 @@ class SearchEngine:
         Yields:
             Path objects for each file that should be searched
         """
-        # Pre-load exclusion patterns for better performance
-        exclusions = self.exclusions_manager.get_combined_exclusions()
-        
-        # Only use path exclusions for directory filtering
-        path_patterns = set()
-        if "language" in exclusions:
-            path_patterns.update(exclusions["language"])
-        if "framework" in exclusions:
-            path_patterns.update(exclusions["framework"])
-        if "user_path" in exclusions:
-            path_patterns.update(exclusions["user_path"])
-            
-        # Use the configured path exclusions instead of hardcoded values
-        common_dir_exclusions = {p.rstrip('/*').rstrip('/') for p in path_patterns}
+        # Pre-load the precompiled path exclusions for better performance
+        matcher = self.exclusions_manager.path_matcher()
         
         for root, dirs, files in os.walk(self.base_dir):
             root_path = Path(root)
             
             # Check if current directory should be excluded based on path exclusions
-            rel_root = str(root_path.relative_to(self.base_dir))
-            skip_dir = False
+            rel_root = root_path.relative_to(self.base_dir)
             
-            # Skip processing if we're in an excluded directory
-            for excluded_dir in common_dir_exclusions:
-                if excluded_dir in rel_root.split('/'):
-                    skip_dir = True
-                    break
-                    
-            if skip_dir:
+            # Skip processing if we're in an excluded directory; the path's
+            # components are tested against every excluded name at once
+            if not matcher.names.isdisjoint(rel_root.parts):
                 # Clear dirs to prevent walking into subdirectories
                 dirs[:] = []
                 continue
                 
             # Filter out excluded directories
-            # This modifies dirs in-place to avoid walking into excluded directories
-            dirs[:] = [d for d in dirs if not self._should_exclude(root_path / d)]
+            # This modifies dirs in-place to avoid walking into excluded directories;
+            # _is_excluded_entry records the statistics for each pruned one
+            dirs[:] = [d for d in dirs if not self._is_excluded_entry(root_path, d, matcher)]
             
             # Yield files that aren't excluded by path patterns
             for file in files:
-                file_path = root_path / file
-                if not self._should_exclude(file_path):
-                    yield file_path
+                if not self._is_excluded_entry(root_path, file, matcher):
+                    yield root_path / file
+    
+    def _is_excluded_entry(self, root_path: Path, name: str, matcher: PathMatcher) -> bool:
+        """Check whether a directory entry found while walking should be excluded.
+        
+        Args:
+            root_path: Directory being walked, already known not to be excluded
+            name: Name of the file or subdirectory in it
+            matcher: The exclusions manager's precompiled path matcher
+            
+        Returns:
+            True if the entry should be excluded
+        """
+        if matcher.by_name_only and not matcher.excludes_name(name):
+            # Its parent directories were kept, so only its own name can match
+            return False
+        return self._should_exclude(root_path / name)
     
     def search(self, query: str, use_regex: bool = False, case_sensitive: bool = True, 
              show_progress: bool = True, use_index: bool = True, wait_for_index: bool = False,
-             max_results: int = 1000, timeout: int = 60) -> List[SearchResult]:
+             max_results: int = 1000, timeout: int = 60,
+             exclusion_regex: Optional[Dict[str, str]] = None) -> List[SearchResult]:
         """Search for a pattern in files under the base directory.
         
         Args:
@@ -225,6 +248,10 @@ class SearchEngine:
             wait_for_index: Whether to wait for indexing to complete before searching
             max_results: Maximum number of results to return
             timeout: Maximum time (in seconds) to spend searching
+            exclusion_regex: Optional "path" and "string" exclusion regexes, as
+                returned by ExclusionsManager.generate_search_exclusion_regex().
+                They are applied during the scan, so max_results counts only
+                hits that survive them.
             
         Returns:
             List of SearchResult objects
@@ -232,6 +259,8 @@ class SearchEngine:
         Raises:
             TimeoutError: If the search takes longer than the specified timeout
         """
+        path_excl_re, string_excl_re = self._compile_exclusion_regex(exclusion_regex)
+        
         # Reset search statistics
         self.search_stats = {
             "files_searched": 0,
@@ -249,9 +278,7 @@ class SearchEngine:
         # Record search start time
         search_start_time = time.time()
         from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-        from rich.console import Console
         from concurrent.futures import ThreadPoolExecutor
-        import threading
         
         results = []
         files_searched = 0
@@ -262,7 +289,7 @@ class SearchEngine:
         indexing_status = self.index_manager.get_indexing_status()
                 # Never wait for indexing - always proceed with search
         if indexing_status.get("is_indexing", False):
-            console.print("[dim]Search proceeding without waiting for indexing...[/dim]")
+            get_console().print("[dim]Search proceeding without waiting for indexing...[/dim]")
 
 # Check if we can use index for this search
         using_index = False
@@ -284,10 +311,19 @@ class SearchEngine:
             
         # Only block if the query is EXACTLY one of the configured path exclusions
         if query in path_patterns:
-            console = Console()
-            console.print(f"[yellow]'{query}' is excluded from searches as it matches a path exclusion pattern.[/yellow]")
+            get_console().print(f"[yellow]'{query}' is excluded from searches as it matches a path exclusion pattern.[/yellow]")
             return []
             
+        # Let ripgrep do the scan when it is available
+        if not using_index:
+            rg_results = self._search_with_rg(
+                query, use_regex, case_sensitive, path_patterns,
+                max_results, timeout, search_start_time,
+                path_excl_re, string_excl_re
+            )
+            if rg_results is not None:
+                return rg_results
+
         # If we can use the index for this search
         if using_index:
             indexed_search_start = time.time()
@@ -334,7 +370,7 @@ class SearchEngine:
                         
                         try:
                             # Apply path exclusions from config, not hardcoded values
-                            if self._should_exclude(file_path):
+                            if self._should_exclude(file_path) or self._excluded_by_regex(file_path, path_excl_re):
                                 with counter_lock:
                                     files_searched += 1
                                 return []
@@ -354,14 +390,11 @@ class SearchEngine:
                                     if i % 1000 == 0 and time.time() - search_start_time > timeout:
                                         raise TimeoutError("Search timed out")
                                         
-                                    matches = list(pattern.finditer(line))
-                                    if matches:
-                                        match_positions = [(m.start(), m.end()) for m in matches]
+                                    if pattern.search(line) and not (string_excl_re and string_excl_re.search(line)):
                                         result = SearchResult(
                                             file_path=file_path,
                                             line_number=i,
-                                            line_content=line.rstrip('\n'),
-                                            match_positions=match_positions
+                                            line_content=line.rstrip('\n')
                                         )
                                         # We've already filtered at the file level, so just add results
                                         file_results.append(result)
@@ -392,7 +425,7 @@ class SearchEngine:
                             TextColumn("[progress.description]{task.description}"),
                             TextColumn("[{task.completed}/{task.total}]"),
                             TimeElapsedColumn(),
-                            console=Console(),
+                            console=get_console(),
                             transient=True
                         ) as progress:
                             # Create progress tasks with indication that we're using the index
@@ -422,8 +455,7 @@ class SearchEngine:
                     
                 except re.error as e:
                     # Handle invalid regex
-                    console = Console()
-                    console.print(f"Invalid regular expression: {str(e)}")
+                    get_console().print(f"Invalid regular expression: {str(e)}")
                     return []
         
         # Fall back to full search if index search was not used or returned no results
@@ -456,13 +488,22 @@ class SearchEngine:
             # Collect all files to search first
             search_files = list(self._walk_files())
             
+            # _walk_files already applied the manager's own path exclusions;
+            # only a caller-supplied regex still needs testing
+            if path_excl_re is self.exclusions_manager.compiled_search_exclusion_regex()[0]:
+                path_excl_re = None
+            
             # Function to search a single file
             def search_file(file_path):
                 nonlocal files_searched, files_matched
                 
+                # Check if we've reached the result limit
+                with counter_lock:
+                    if len(results) >= max_results:
+                        return []
+                
                 try:
-                    # Apply path exclusions from config, not hardcoded values
-                    if self._should_exclude(file_path):
+                    if self._excluded_by_regex(file_path, path_excl_re):
                         with counter_lock:
                             files_searched += 1
                         return []
@@ -478,17 +519,19 @@ class SearchEngine:
                     file_results = []
                     with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
                         for i, line in enumerate(f, start=1):
-                            matches = list(pattern.finditer(line))
-                            if matches:
-                                match_positions = [(m.start(), m.end()) for m in matches]
+                            if pattern.search(line) and not (string_excl_re and string_excl_re.search(line)):
                                 result = SearchResult(
                                     file_path=file_path,
                                     line_number=i,
-                                    line_content=line.rstrip('\n'),
-                                    match_positions=match_positions
+                                    line_content=line.rstrip('\n')
                                 )
                                 # We've already filtered at the file level, so just add results
                                 file_results.append(result)
+                                
+                                # Check if adding these results would exceed max_results
+                                with counter_lock:
+                                    if len(results) + len(file_results) >= max_results:
+                                        break
                     
                     with counter_lock:
                         files_searched += 1
@@ -509,7 +552,7 @@ class SearchEngine:
                     TextColumn("[progress.description]{task.description}"),
                     TextColumn("[{task.completed}/{task.total}]"),
                     TimeElapsedColumn(),
-                    console=Console(),
+                    console=get_console(),
                     transient=True
                 ) as progress:
                     # Create progress tasks
@@ -531,15 +574,187 @@ class SearchEngine:
                 # No progress indicator, simpler execution
                 for file_path in search_files:
                     results.extend(search_file(file_path))
+                    if len(results) >= max_results:
+                        break
+            
+            # Files searched in parallel can together pass the limit
+            del results[max_results:]
                     
         except re.error as e:
             # Handle invalid regex
-            console = Console()
-            console.print(f"Invalid regular expression: {str(e)}")
+            get_console().print(f"Invalid regular expression: {str(e)}")
             return []
             
         return results
     
+    def _compile_exclusion_regex(self, exclusion_regex: Optional[Dict[str, str]]
+                                 ) -> Tuple[Optional[Pattern], Optional[Pattern]]:
+        """Compile the path and string exclusion regexes passed to search().
+        
+        Args:
+            exclusion_regex: Dict with optional "path" and "string" regexes
+            
+        Returns:
+            Tuple of (path regex, string regex); each is None when not given,
+            empty, or the never-matching "(?!)" placeholder
+        """
+        if not exclusion_regex:
+            return None, None
+        
+        # The exclusions manager's own regexes are already compiled
+        if exclusion_regex is self.exclusions_manager.generate_search_exclusion_regex():
+            return self.exclusions_manager.compiled_search_exclusion_regex()
+        
+        compiled = []
+        for key in ("path", "string"):
+            pattern = exclusion_regex.get(key)
+            compiled.append(re.compile(pattern) if pattern and pattern != "(?!)" else None)
+        return compiled[0], compiled[1]
+    
+    def _excluded_by_regex(self, file_path: Union[str, Path], path_excl_re: Optional[Pattern]) -> bool:
+        """Check a file's path, relative to the base directory, against the path exclusion regex.
+        
+        Args:
+            file_path: Path to check
+            path_excl_re: Compiled path exclusion regex, or None
+            
+        Returns:
+            True if the relative path matches the regex
+        """
+        if path_excl_re is None:
+            return False
+        rel_path = os.path.relpath(file_path, self.base_dir)
+        if path_excl_re is self.exclusions_manager.compiled_search_exclusion_regex()[0]:
+            # The manager's own patterns: test them with its precompiled PathMatcher
+            return self.exclusions_manager.matches(rel_path)
+        return path_excl_re.search(rel_path) is not None
+    
+    def _search_with_rg(self, query: str, use_regex: bool, case_sensitive: bool,
+                        path_patterns: Set[str], max_results: int, timeout: int,
+                        search_start_time: float, path_excl_re: Optional[Pattern] = None,
+                        string_excl_re: Optional[Pattern] = None) -> Optional[List[SearchResult]]:
+        """Search with ripgrep, streaming its JSON output into SearchResults.
+        
+        Path exclusions are passed to ripgrep as negated globs so excluded
+        directories are never entered.
+        
+        Args:
+            query: Search query
+            use_regex: Whether to interpret the query as a regex pattern
+            case_sensitive: Whether to perform case-sensitive search
+            path_patterns: Path exclusion patterns
+            max_results: Maximum number of results to return
+            timeout: Maximum time (in seconds) to spend searching
+            search_start_time: When the search started, from time.time()
+            path_excl_re: Compiled path exclusion regex, applied to relative paths
+            string_excl_re: Compiled string exclusion regex, applied to matched lines
+            
+        Returns:
+            List of SearchResult objects, or None when ripgrep is unavailable
+            or rejected the query, in which case the caller falls back to the
+            Python scanner
+        
+        Raises:
+            TimeoutError: If the search takes longer than the specified timeout
+        """
+        if not RG_PATH:
+            return None
+        
+        # Match the Python scanner: search hidden and git-ignored files too
+        args = [RG_PATH, "--json", "--line-number", "--hidden", "--no-ignore"]
+        if not use_regex:
+            args.append("--fixed-strings")
+        if not case_sensitive:
+            args.append("--ignore-case")
+        for pattern in sorted(path_patterns):
+            args.append(f"--glob=!{pattern}")
+        args += ["--", query, str(self.base_dir)]
+        
+        remaining = search_start_time + timeout - time.time()
+        if remaining <= 0:
+            raise TimeoutError("Search timed out")
+        
+        results = []
+        matched_files = set()
+        try:
+            process = subprocess.Popen(
+                args, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+        except OSError:
+            return None
+        
+        # Drain stderr on the side so a flood of per-file errors cannot
+        # block ripgrep while stdout is read
+        stderr_chunks = []
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_chunks.append(process.stderr.read()), daemon=True
+        )
+        stderr_reader.start()
+        
+        # Kill ripgrep at the deadline even when it prints nothing; its
+        # stdout then reaches EOF and the loop below ends
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            process.kill()
+        
+        watchdog = threading.Timer(remaining, kill_on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+        
+        try:
+            for raw_line in process.stdout:
+                event = json.loads(raw_line)
+                if event["type"] != "match":
+                    continue
+                
+                data = event["data"]
+                path_text = data["path"].get("text")
+                line_text = data["lines"].get("text")
+                if path_text is None or line_text is None:
+                    # Not valid UTF-8; ripgrep sent it base64-encoded
+                    continue
+                
+                # Drop excluded hits before they count towards max_results
+                if string_excl_re and string_excl_re.search(line_text):
+                    continue
+                if self._excluded_by_regex(path_text, path_excl_re):
+                    continue
+                
+                results.append(SearchResult(
+                    file_path=Path(path_text),
+                    line_number=data["line_number"],
+                    line_content=line_text.rstrip('\n')
+                ))
+                matched_files.add(path_text)
+                if len(results) >= max_results:
+                    break
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            returncode = process.wait()
+            stderr_reader.join()
+            process.stderr.close()
+        
+        if timed_out.is_set() and len(results) < max_results:
+            raise TimeoutError("Search timed out")
+        
+        # Exit status 2 is also used for unreadable files; only fall back to
+        # Python when ripgrep rejected the query itself (e.g. regex syntax it
+        # does not support)
+        stderr_text = b"".join(stderr_chunks).decode("utf-8", "replace")
+        if returncode == 2 and not results and any(phrase in stderr_text for phrase in _RG_REJECTED):
+            return None
+        
+        self.search_stats["files_with_matches"] = len(matched_files)
+        self.search_stats["match_count"] = len(results)
+        self.search_stats["exclusion_patterns_used"] = len(path_patterns)
+        self.search_stats["search_time"] = time.time() - search_start_time
+        return results
+    
     def _is_binary_file(self, file_path: Path) -> bool:
         """Check if a file is binary.
         
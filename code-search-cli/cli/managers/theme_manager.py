@@ -1,6 +1,12 @@
 import yaml
 from pathlib import Path
 
+# Prefer the libyaml-backed C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
 class ThemeManager:
     """Manages the global CLI theme (light or dark mode)."""
 
@@ -35,14 +41,16 @@ class ThemeManager:
     }
 
     _current_theme = DEFAULT_THEME
+    _loaded = False
 
     @classmethod
     def load_theme(cls):
         """Loads the theme from disk or sets default."""
+        cls._loaded = True
         if cls.THEME_FILE.exists():
             try:
                 with open(cls.THEME_FILE, "r") as f:
-                    theme_data = yaml.safe_load(f)
+                    theme_data = yaml.load(f, Loader=_SafeLoader)
                     cls._current_theme = theme_data.get("theme", cls.DEFAULT_THEME)
             except Exception:
                 cls._current_theme = cls.DEFAULT_THEME
@@ -55,18 +63,18 @@ class ThemeManager:
         if theme not in cls.THEMES:
             raise ValueError(f"Invalid theme: {theme}")
         cls._current_theme = theme
+        cls._loaded = True
         with open(cls.THEME_FILE, "w") as f:
-            yaml.safe_dump({"theme": theme}, f)
+            yaml.dump({"theme": theme}, f, Dumper=_SafeDumper)
 
     @classmethod
     def get_theme(cls):
-        """Returns the current theme's color settings."""
+        """Returns the current theme's color settings, reading theme.yaml on first use."""
+        if not cls._loaded:
+            cls.load_theme()
         return cls.THEMES.get(cls._current_theme, cls.THEMES[cls.DEFAULT_THEME])
 
     @classmethod
     def set_theme(cls, theme: str):
         """Sets the theme globally and persists it."""
-        cls.save_theme(theme)
-
-# Load theme on startup
-ThemeManager.load_theme()
\ No newline at end of file
+        cls.save_theme(theme)
\ No newline at end of file
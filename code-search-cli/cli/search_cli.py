@@ -13,8 +13,10 @@ from cli.commands.exclusions_command import (
 from cli.commands.init_command import init
 from cli.commands.help_command import show_help
 import platform
+import shlex
 import subprocess
 from cli.managers.config_manager import ConfigManager
+from cli.managers.exclusions_manager import configured_dirnames
 from cli.managers.theme_manager import ThemeManager
 from cli.logger import setup_logger
 
@@ -48,10 +50,14 @@ def handle_search_command(query, base_dir):
     files_searched = 0
     files_with_matches = 0
     
+    # Common excluded directories plus the configured plain-name exclusions
+    excluded_dirs = {".git", "node_modules", "vendor"}
+    excluded_dirs |= configured_dirnames(config)
+    
     # Walk the directory tree
     for root, dirs, files in os.walk(current_base_dir):
-        # Skip common excluded directories
-        dirs[:] = [d for d in dirs if d not in [".git", "node_modules", "vendor"]]
+        # Skip excluded directories without descending into them
+        dirs[:] = [d for d in dirs if d not in excluded_dirs]
         
         for file in files:
             # Skip binary and non-text files
@@ -102,11 +108,6 @@ def handle_search_command(query, base_dir):
                 files_with_matches[rel_path] = {"path": file_path, "matches": []}
             files_with_matches[rel_path]["matches"].append((line_num, content))
         
-        # Get the user's editor config
-        config = ConfigManager()
-        editor_config = config.get_editor_config()
-        editor_name = editor_config.get("name", "default")
-        
         # Display results with file paths and match counts
         print(f"Found matches in {len(files_with_matches)} files:")
         
@@ -118,29 +119,6 @@ def handle_search_command(query, base_dir):
             # Get first match line number for better navigation
             first_line = file_data["matches"][0][0] if file_data["matches"] else 1
             
-            # Create command for opening with the configured editor
-            if editor_name == "vscode":
-                cmd = f"code --goto {abs_path}:{first_line}"
-            elif editor_name == "jetbrains":
-                cmd = f"idea {abs_path}:{first_line}"
-            elif editor_name == "sublime":
-                cmd = f"subl {abs_path}:{first_line}"
-            elif editor_name == "vim":
-                cmd = f"vim +{first_line} {abs_path}"
-            elif editor_name == "emacs":
-                cmd = f"emacs +{first_line} {abs_path}"
-            elif editor_name == "custom":
-                custom_cmd = editor_config.get("command", "")
-                cmd = custom_cmd.replace("%file%", abs_path).replace("%line%", str(first_line))
-            else:
-                # Default to just opening the file with system default
-                if platform.system() == "Darwin":  # macOS
-                    cmd = f"open {abs_path}"
-                elif platform.system() == "Windows":
-                    cmd = f"start {abs_path}"
-                else:
-                    cmd = f"xdg-open {abs_path}"
-            
             # Create VS Code clickable link (works in iTerm2)
             vscode_url = f"vscode://file/{abs_path}:{first_line}"
             
@@ -177,6 +155,32 @@ def handle_search_command(query, base_dir):
     # Add a blank line to separate from next prompt
     print("")
 
+# argv templates for the built-in editors; %file% and %line% are filled in per call
+EDITOR_ARGV = {
+    "vscode": ["code", "--goto", "%file%:%line%"],
+    "jetbrains": ["idea", "%file%:%line%"],
+    "sublime": ["subl", "%file%:%line%"],
+    "vim": ["vim", "+%line%", "%file%"],
+    "emacs": ["emacs", "+%line%", "%file%"],
+}
+
+def editor_argv(editor_config, abs_path, line_num):
+    """Build the argv that opens abs_path at line_num in the configured editor."""
+    editor_name = editor_config.get("name", "default")
+    if editor_name in EDITOR_ARGV:
+        template = EDITOR_ARGV[editor_name]
+    elif editor_name == "custom":
+        template = shlex.split(editor_config.get("command", ""))
+    elif platform.system() == "Darwin":  # macOS
+        template = ["open", "%file%"]
+    else:
+        template = ["xdg-open", "%file%"]
+    
+    return [
+        arg.replace("%file%", str(abs_path)).replace("%line%", str(line_num))
+        for arg in template
+    ]
+
 def handle_open_command(file_num):
     """Handle opening a file from search results by number."""
     global file_open_commands
@@ -201,35 +205,17 @@ def handle_open_command(file_num):
         editor_config = config.get_editor_config()
         editor_name = editor_config.get("name", "default")
         
-        # Create command based on the configured editor
-        if editor_name == "vscode":
-            cmd = f"code --goto {abs_path}:{line_num}"
-        elif editor_name == "jetbrains":
-            cmd = f"idea {abs_path}:{line_num}"
-        elif editor_name == "sublime":
-            cmd = f"subl {abs_path}:{line_num}"
-        elif editor_name == "vim":
-            cmd = f"vim +{line_num} {abs_path}"
-        elif editor_name == "emacs":
-            cmd = f"emacs +{line_num} {abs_path}"
-        elif editor_name == "custom":
-            custom_cmd = editor_config.get("command", "")
-            cmd = custom_cmd.replace("%file%", abs_path).replace("%line%", str(line_num))
-        else:
-            # Default to system default
-            if platform.system() == "Darwin":  # macOS
-                cmd = f"open {abs_path}"
-            elif platform.system() == "Windows":
-                cmd = f"start {abs_path}"
-            else:
-                cmd = f"xdg-open {abs_path}"
-                
         print(f"\nOpening {rel_path}:{line_num}...")
         
         # Execute the command
         try:
-            # Use subprocess.Popen to avoid waiting for the process to complete
-            subprocess.Popen(cmd, shell=True)
+            if editor_name not in EDITOR_ARGV and editor_name != "custom" and platform.system() == "Windows":
+                # `start` is a cmd.exe builtin; ask the shell API directly
+                os.startfile(abs_path)
+            else:
+                # Use subprocess.Popen to avoid waiting for the process to complete.
+                # An argv list needs no shell and no quoting for paths with spaces.
+                subprocess.Popen(editor_argv(editor_config, abs_path, line_num))
         except Exception as e:
             print(f"Error opening file: {e}")
             
@@ -261,7 +247,7 @@ def handle_command(ctx, command_input, base_dir):
         # Command Routing Table
         command_map = {
             "": lambda: ctx.invoke(show_help),  # `:` triggers help
-            "help": lambda: ctx.invoke(show_help),  # `: help` shows help
+            "help": lambda: ctx.invoke(show_help, topic=args[1] if len(args) > 1 else None),  # `: help [topic]` shows help
             "init": lambda: handle_init_command(),  # `: init` resets root dir
             "list": lambda: ctx.invoke(list_exclusions),  # `: list` lists exclusions
             "add": lambda: ctx.invoke(add_exclusion),  # `: add` starts exclusion addition
@@ -283,6 +269,13 @@ def handle_command(ctx, command_input, base_dir):
     except Exception as e:
         console.print(f"Command error: {str(e)}")
 
+# Answers accepted as "yes" by REPL confirmations; an empty answer also means yes
+_YES_ANSWERS = {"", "y", "yes"}
+
+def _confirm(question: str) -> bool:
+    """Ask a [Y,n] question on the REPL's own stdin and return the answer."""
+    return input(f"{question} [Y,n] ").strip().lower() in _YES_ANSWERS
+
 def handle_init_command():
     """Initialize the search directory."""
     config = ConfigManager()
@@ -290,10 +283,7 @@ def handle_init_command():
 
     if current_base_dir:
         print(f"\nThe existing root directory is: {current_base_dir}")
-        print(f"\nWould you like to change it? [Y,n] ", end="")
-        change_dir = input().strip().lower() or "y"
-
-        if change_dir != "y":
+        if not _confirm("\nWould you like to change it?"):
             print(f"No changes made to the search directory.")
             return
 
@@ -305,10 +295,7 @@ def handle_init_command():
             print(f"Invalid directory path. Please enter a valid path.")
             new_base_dir = ""
 
-    print(f"\nPlease confirm new root directory: {new_base_dir} [Y,n] ", end="")
-    confirm = input().strip().lower() or "y"
-
-    if confirm != "y":
+    if not _confirm(f"\nPlease confirm new root directory: {new_base_dir}"):
         print(f"Setup aborted. No changes were made.")
         return
 
@@ -13,6 +13,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/code-search-cli",
     packages=find_packages(),
+    package_data={"cli.commands": ["data/*.md"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
@@ -29,7 +30,6 @@ setup(
         "pyyaml",
         "python-dotenv",
         "rich",
-        "loguru",
     ],
     entry_points={
         "console_scripts": [
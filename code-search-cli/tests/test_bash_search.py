@@ -0,0 +1,38 @@
+"""Tests for bash_search's optional C scanner against its Python fallback."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# bash_search.py and the _scan extension live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+_scan = pytest.importorskip("_scan", reason="the _scan extension is not built")
+import bash_search
+
+CONTENTS = [
+    b"needle at the start\nplain line\n",
+    b"first\nends with needle",
+    b"needle needle twice on one line\nneedle\n\nneedle again\n",
+    b"windows\r\nline with needle\r\n",
+    b"no match here\n",
+    b"\n\n\nneedle after blank lines",
+]
+
+@pytest.mark.parametrize("content", CONTENTS)
+def test_c_scan_matches_python_fallback(tmp_path, monkeypatch, content):
+    """Test that the extension yields the same lines as the bytes.find loop."""
+    path = tmp_path / "sample.txt"
+    path.write_bytes(content)
+
+    monkeypatch.setattr(bash_search, "c_scan", _scan.scan)
+    with_extension = list(bash_search.scan_file(str(path), b"needle"))
+    monkeypatch.setattr(bash_search, "c_scan", None)
+    fallback = list(bash_search.scan_file(str(path), b"needle"))
+
+    assert with_extension == fallback
+
+def test_c_scan_offsets():
+    """Test the raw (line_number, start, end) tuples, with end before the newline."""
+    assert _scan.scan(b"a\nxneedle\nb\nneedle", b"needle") == [(2, 2, 9), (4, 12, 18)]
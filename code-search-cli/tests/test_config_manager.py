@@ -0,0 +1,71 @@
+"""Tests for ConfigManager's batched, atomic saves."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from cli.managers import config_manager as config_manager_module
+from cli.managers.config_manager import EXCLUSION_SCAN_KEY, ConfigManager
+
+@pytest.fixture
+def config_manager(tmp_path, monkeypatch):
+    """Create a ConfigManager whose settings.yaml lives in a temporary directory.
+
+    The config directory is derived from the module's location, so the module
+    is moved under tmp_path. The settings name an already scanned base
+    directory, which skips first-time setup and the exclusion scan.
+    """
+    base_dir = tmp_path / "project"
+    base_dir.mkdir()
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    (config_dir / "settings.yaml").write_text(yaml.safe_dump({
+        "base_dir": str(base_dir),
+        EXCLUSION_SCAN_KEY: base_dir.stat().st_mtime_ns,
+    }))
+    monkeypatch.setattr(config_manager_module, "__file__", str(tmp_path / "managers" / "config_manager.py"))
+    return ConfigManager()
+
+def _stored(manager):
+    """Parse the settings.yaml the manager writes to."""
+    return yaml.safe_load(manager.config_file.read_text())
+
+def test_batch_writes_once_on_exit(config_manager):
+    """Test that every save inside a batch, nested or not, becomes one write."""
+    with patch("cli.managers.config_manager.os.replace", wraps=os.replace) as replace:
+        with config_manager.batch():
+            config_manager.set_editor_config({"name": "vim", "command": "vim", "args": []})
+            with config_manager.batch():
+                config_manager.add_exclusion("dist")
+            assert "editor" not in _stored(config_manager)
+        assert replace.call_count == 1
+
+    stored = _stored(config_manager)
+    assert stored["editor"]["name"] == "vim"
+    assert stored["exclusions"]["user_path"] == ["dist"]
+
+def test_flush_skips_unchanged_config(config_manager):
+    """Test that saving the config the file already holds does not rewrite it."""
+    config_manager.set_editor_config({"name": "vim", "command": "vim", "args": []})
+    with patch("cli.managers.config_manager.os.replace") as replace:
+        config_manager.save_config(config_manager.config)
+    replace.assert_not_called()
+
+def test_flush_leaves_no_temporary_file(config_manager):
+    """Test that the config is written through a temporary file renamed into place."""
+    config_manager.add_exclusion("dist")
+    assert sorted(os.listdir(config_manager.config_dir)) == ["settings.yaml"]
+    assert config_manager.state_token() == config_manager.config_file.stat().st_mtime_ns
+
+def test_unsorted_stored_exclusions_are_not_duplicated(config_manager):
+    """Test that lists stored unsorted by hand are sorted on load before bisecting."""
+    config_manager.config_file.write_text(yaml.safe_dump({
+        "base_dir": config_manager.get_base_dir(),
+        "exclusions": {"system_generated": [], "user_path": ["zeta", "alpha", "zeta"], "user_string": []},
+    }))
+    config_manager.config = config_manager._load_config()
+
+    config_manager.add_exclusion("zeta")
+    assert _stored(config_manager)["exclusions"]["user_path"] == ["alpha", "zeta"]
@@ -0,0 +1,149 @@
+"""Tests for the exclusions manager and its path matchers."""
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from cli.managers.exclusions_manager import ExclusionTrie, ExclusionsManager, PathMatcher, configured_dirnames
+
+@pytest.fixture
+def trie():
+    """Create a trie holding literal and glob multi-segment patterns."""
+    trie = ExclusionTrie()
+    for pattern in ("vendor/bundle", "bootstrap/cache", "storage/*.log", "app/*/generated", "a/b/c?"):
+        trie.add(pattern)
+    return trie
+
+class TestExclusionTrie:
+    """Tests for the ExclusionTrie class."""
+
+    @pytest.mark.parametrize("path", [
+        "vendor/bundle",
+        "vendor/bundle/gems/rake.rb",
+        "bootstrap/cache/services.php",
+        "storage/laravel.log",
+        "storage/logs/old/laravel.log",
+        "app/models/generated",
+        "app/models/generated/schema.py",
+        "a/b/c1",
+        "a/b/c1/deep/file.txt",
+    ])
+    def test_excluded_paths(self, trie, path):
+        """Test that literal and glob patterns exclude the path and everything below it."""
+        assert trie.is_excluded(tuple(path.split("/")))
+
+    @pytest.mark.parametrize("path", [
+        "vendor",
+        "vendor/other/bundle",
+        "src/vendor/bundle",
+        "bootstrap/app.php",
+        "storage/laravel.txt",
+        "app/generated",
+        "a/b/c",
+        "a/b/c12",
+    ])
+    def test_kept_paths(self, trie, path):
+        """Test that paths only sharing a prefix or a name with a pattern are kept."""
+        assert not trie.is_excluded(tuple(path.split("/")))
+
+    def test_glob_spanning_segments(self):
+        """Test that a glob's "*" matches across directory separators."""
+        trie = ExclusionTrie()
+        trie.add("docs/*.md")
+        assert trie.is_excluded(("docs", "guide", "intro.md"))
+        assert not trie.is_excluded(("docs", "guide", "intro.txt"))
+
+class TestPathMatcher:
+    """Tests for the PathMatcher class."""
+
+    @pytest.fixture
+    def matcher(self):
+        """Create a matcher with one pattern of every kind."""
+        return PathMatcher(["node_modules", "*.pyc", "*.tar.gz", "build/", "bootstrap/cache", "tmp-*"])
+
+    @pytest.mark.parametrize("path", [
+        "node_modules",
+        "src/node_modules/pkg/index.js",
+        "app/module.pyc",
+        "dist/release.tar.gz",
+        "build/out.js",
+        "web/build/out.js",
+        "bootstrap/cache/config.php",
+        "tmp-1/notes.txt",
+    ])
+    def test_excluded_paths(self, matcher, path):
+        """Test that each kind of pattern excludes a path or its parent directory."""
+        assert matcher.matches(path)
+
+    @pytest.mark.parametrize("path", [
+        "src/app.py",
+        "node_modules_backup/index.js",
+        "dist/release.tar",
+        "builder/out.js",
+        "src/bootstrap/cache.php",
+    ])
+    def test_kept_paths(self, matcher, path):
+        """Test that paths merely resembling a pattern are kept."""
+        assert not matcher.matches(path)
+
+    def test_excludes_name(self, matcher):
+        """Test that single names are checked against plain names and suffixes only."""
+        assert matcher.excludes_name("node_modules")
+        assert matcher.excludes_name("module.pyc")
+        assert matcher.excludes_name("release.tar.gz")
+        assert not matcher.excludes_name("module.py")
+
+    def test_by_name_only(self, matcher):
+        """Test that only plain names and suffixes allow name-only checks."""
+        assert PathMatcher(["node_modules", "*.pyc"]).by_name_only
+        assert not matcher.by_name_only
+
+def test_configured_dirnames_reads_stored_exclusions():
+    """Test that the plain names come from the config without building a manager."""
+    config = MagicMock()
+    config.get_exclusions.return_value = {
+        "system_generated": ["node_modules", "*.pyc", "bootstrap/cache"],
+        "user_path": ["./build/", "logs/*"],
+        "user_string": ["TODO"],
+    }
+    assert configured_dirnames(config) == {"node_modules", "build", "logs"}
+
+def test_stored_frameworks_tied_to_their_directory(tmp_path):
+    """Test that frameworks stored for another directory with the same mtime are not reused."""
+    first, second = tmp_path / "first", tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    (second / "Cargo.toml").write_text("")
+    os.utime(first, ns=(0, 0))
+    os.utime(second, ns=(0, 0))
+
+    config = MagicMock()
+    config.get_base_dir.return_value = str(second)
+    config.get_exclusions.return_value = {"system_generated": [], "user_path": [], "user_string": []}
+    config.get_frameworks.return_value = ["Laravel"]
+    config.get_frameworks_detected_at.return_value = (os.path.realpath(first), 0)
+
+    manager = ExclusionsManager(str(second), config)
+    assert manager.detected_frameworks == {"Rust"}
+    assert manager.detected_at == (os.path.realpath(second), 0)
+
+def test_base_dir_change_refreshes_sorted_exclusions(tmp_path):
+    """Test that switching base directories re-sorts the listed exclusions for the new codebase."""
+    python_dir, rust_dir = tmp_path / "python", tmp_path / "rust"
+    python_dir.mkdir()
+    rust_dir.mkdir()
+    (python_dir / "setup.py").write_text("")
+    (rust_dir / "Cargo.toml").write_text("")
+
+    config = MagicMock()
+    config.get_base_dir.return_value = str(python_dir)
+    config.get_exclusions.return_value = {"system_generated": [], "user_path": [], "user_string": []}
+    config.get_frameworks.return_value = []
+    manager = ExclusionsManager(str(python_dir), config)
+    assert "__pycache__" in manager.sorted_language_exclusions()
+
+    config.get_base_dir.return_value = str(rust_dir)
+    manager.update_exclusions()
+    assert manager.sorted_language_exclusions() == tuple(sorted(ExclusionsManager.EXCLUSIONS_BY_LANGUAGE["Rust"]))
+    assert manager.get_combined_exclusions()["language"] == ExclusionsManager.EXCLUSIONS_BY_LANGUAGE["Rust"]
@@ -0,0 +1,67 @@
+"""Tests for the direct search injected by index_fix."""
+
+import re
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from cli.managers import index_fix
+
+@pytest.fixture
+def injected(tmp_path, monkeypatch):
+    """Apply disable_output_interleaving to a stub search_cli.py and load the result."""
+    target = tmp_path / "code-search-cli" / "cli" / "search_cli.py"
+    target.parent.mkdir(parents=True)
+    target.write_text(
+        "import os\nimport re\nfrom pathlib import Path\n\n"
+        "def handle_search_command(query, base_dir):\n    pass\n\n"
+        "def main():\n    pass\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    assert index_fix.disable_output_interleaving()
+
+    namespace = {}
+    exec(compile(target.read_text(), str(target), "exec"), namespace)
+    return namespace
+
+@pytest.fixture
+def search_engine(tmp_path):
+    """Create a stand-in search engine over a few files."""
+    files = {
+        "codes.txt": "area 456\nno digits here\n",
+        "tags.txt": "xxy\nxy\nxxxy\n",
+        "greeting.txt": "HELLO there\n",
+    }
+    paths = []
+    for name, content in files.items():
+        path = tmp_path / name
+        path.write_text(content)
+        paths.append(path)
+
+    engine = MagicMock()
+    engine._walk_files.return_value = paths
+    engine.exclusions_manager.compiled_search_exclusion_regex.return_value = (None, None)
+    engine.search.return_value = []
+    return engine
+
+@pytest.mark.parametrize("query, expected", [
+    ("456", [("codes.txt", 1)]),
+    ("xy", [("tags.txt", 1), ("tags.txt", 2), ("tags.txt", 3)]),
+    # Regex metacharacters are plain text; the handler never searches by regex
+    ("x{2,3}y", []),
+    ("hello", []),
+])
+def test_direct_search_literal(injected, search_engine, query, expected):
+    """Test that queries are found as literal, case-sensitive text."""
+    results = injected["_direct_search"](search_engine, query)
+    assert [(Path(r.file_path).name, r.line_number) for r in results] == expected
+    search_engine.search.assert_not_called()
+
+def test_direct_search_applies_string_exclusions_and_limit(injected, search_engine):
+    """Test that excluded lines are skipped before max_results is applied."""
+    search_engine.exclusions_manager.compiled_search_exclusion_regex.return_value = (None, re.compile("^xy$"))
+    results = injected["_direct_search"](search_engine, "xy", max_results=1)
+    assert [(Path(r.file_path).name, r.line_number) for r in results] == [("tags.txt", 1)]
+    results = injected["_direct_search"](search_engine, "y", max_results=5)
+    assert [r.line_number for r in results] == [1, 3]
@@ -1,6 +1,10 @@
 """Tests for the search engine."""
 
+import io
+import json
 import os
+import re
+import time
 import pytest
 import tempfile
 from pathlib import Path
@@ -126,4 +130,126 @@ class TestSearchEngine:
         
         # Check that excluded files aren't in results
         assert not any(".py" in str(result.file_path) for result in results)
-        assert not any("dir1" in str(result.file_path) for result in results)
\ No newline at end of file
+        assert not any("dir1" in str(result.file_path) for result in results)
+
+
+class FakeRipgrep:
+    """Stand-in for a ripgrep process that prints canned JSON events."""
+    
+    def __init__(self, events, returncode=0, stderr=b""):
+        self.stdout = io.BytesIO(b"".join(json.dumps(event).encode() + b"\n" for event in events))
+        self.stderr = io.BytesIO(stderr)
+        self.returncode = returncode
+    
+    def poll(self):
+        return self.returncode
+    
+    def kill(self):
+        pass
+    
+    def wait(self):
+        return self.returncode
+
+
+def _rg_match(path, line_number, text):
+    """Build a ripgrep --json match event."""
+    return {"type": "match", "data": {
+        "path": {"text": path},
+        "lines": {"text": text},
+        "line_number": line_number,
+        "submatches": [],
+    }}
+
+
+class TestSearchWithRipgrep:
+    """Tests for parsing ripgrep's JSON output in SearchEngine._search_with_rg."""
+    
+    @pytest.fixture
+    def search_engine(self, tmp_path, mock_config_manager, monkeypatch):
+        """Create a search engine over an empty directory, with ripgrep reported as installed."""
+        monkeypatch.setattr("cli.managers.search_engine.RG_PATH", "rg")
+        mock_config_manager.get_base_dir.return_value = str(tmp_path)
+        return SearchEngine(tmp_path, mock_config_manager)
+    
+    def _search(self, search_engine, process, **kwargs):
+        """Run _search_with_rg against a fake process; return (rg arguments, results)."""
+        with patch("cli.managers.search_engine.subprocess.Popen", return_value=process) as popen:
+            results = search_engine._search_with_rg(
+                "test", False, True, {"node_modules"}, kwargs.pop("max_results", 100), 60,
+                time.time(), **kwargs
+            )
+        return popen.call_args[0][0], results
+    
+    def test_parses_match_events(self, search_engine, tmp_path):
+        """Test that match events become results and other events are skipped."""
+        path = str(tmp_path / "a.py")
+        process = FakeRipgrep([
+            {"type": "begin", "data": {"path": {"text": path}}},
+            _rg_match(path, 3, "a test line\n"),
+            # Non-UTF-8 lines arrive base64-encoded and are skipped
+            {"type": "match", "data": {"path": {"text": path}, "lines": {"bytes": "dGVzdA=="},
+                                       "line_number": 4, "submatches": []}},
+            _rg_match(path, 7, "another test\r\n"),
+            {"type": "end", "data": {"path": {"text": path}}},
+            {"type": "summary", "data": {}},
+        ])
+        args, results = self._search(search_engine, process)
+        
+        assert "--fixed-strings" in args
+        assert "--glob=!node_modules" in args
+        assert [(str(r.file_path), r.line_number, r.line_content) for r in results] == [
+            (path, 3, "a test line"),
+            (path, 7, "another test\r"),
+        ]
+        assert search_engine.search_stats["files_with_matches"] == 1
+    
+    def test_string_exclusions_do_not_count_towards_max_results(self, search_engine, tmp_path):
+        """Test that excluded lines are dropped before max_results is applied."""
+        path = str(tmp_path / "a.py")
+        process = FakeRipgrep([_rg_match(path, n, f"test {n} TODO\n" if n < 3 else f"test {n}\n")
+                               for n in range(1, 6)])
+        _, results = self._search(search_engine, process, max_results=2,
+                                  string_excl_re=re.compile("TODO"))
+        assert [r.line_number for r in results] == [3, 4]
+    
+    def test_rejected_query_falls_back(self, search_engine):
+        """Test that a query ripgrep cannot parse is handed to the Python scanner."""
+        process = FakeRipgrep([], returncode=2, stderr=b"rg: regex parse error:\n    (?<=a)b\n")
+        assert self._search(search_engine, process)[1] is None
+    
+    def test_unreadable_files_do_not_fall_back(self, search_engine):
+        """Test that per-file I/O errors keep ripgrep's (empty) results."""
+        process = FakeRipgrep([], returncode=2, stderr=b"rg: ./secret: Permission denied (os error 13)\n")
+        assert self._search(search_engine, process)[1] == []
+
+
+def test_walk_records_pruned_directories(test_directory, mock_config_manager):
+    """Test that directories pruned by name still count in the exclusion statistics."""
+    mock_config_manager.get_base_dir.return_value = str(test_directory)
+    mock_config_manager.get_exclusions.return_value = {
+        "system_generated": [], "user_path": ["node_modules"], "user_string": []
+    }
+    search_engine = SearchEngine(test_directory, mock_config_manager)
+    
+    walked = {path.relative_to(test_directory).as_posix() for path in search_engine._walk_files()}
+    
+    assert "node_modules/ignored.js" not in walked
+    assert search_engine.search_stats["excluded_by_pattern"]["node_modules"] == 1
+    assert search_engine.search_stats["files_excluded"] >= 1
+
+
+@pytest.mark.parametrize("show_progress", [False, True])
+def test_python_scan_applies_max_results_after_string_exclusions(tmp_path, mock_config_manager, monkeypatch,
+                                                                 show_progress):
+    """Test that the full scan without ripgrep stops at max_results, counting only kept lines."""
+    monkeypatch.setattr("cli.managers.search_engine.RG_PATH", None)
+    for n in range(3):
+        (tmp_path / f"file{n}.txt").write_text("test TODO\ntest one\ntest two\n")
+    mock_config_manager.get_base_dir.return_value = str(tmp_path)
+    search_engine = SearchEngine(tmp_path, mock_config_manager)
+    
+    results = search_engine.search("test", show_progress=show_progress, max_results=4,
+                                   exclusion_regex={"string": "TODO"})
+    
+    assert len(results) == 4
+    assert not any("TODO" in result.line_content for result in results)